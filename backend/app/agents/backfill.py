@@ -12,18 +12,22 @@ Usage (via API):
 State file: backend/data/backfill_state.json
 """
 import asyncio
-import json
+import functools
 import logging
+import os
+import random
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 import httpx
+import orjson
 
 from app.core.config import get_settings
 from app.core.database import get_db_session
 from app.models.schemas import Opportunity, SearchFilters
-from app.services.db_ops import upsert_opportunities
+from app.services.db_ops import bulk_insert_opportunities_fast, upsert_opportunities
 from app.services.sam_api import SAMGovClient
 
 logger = logging.getLogger(__name__)
@@ -31,17 +35,31 @@ logger = logging.getLogger(__name__)
 _STATE_FILE = Path(__file__).parent.parent.parent / "data" / "backfill_state.json"
 PAGE_SIZE = 100          # SAM.gov supports up to 1000, 100 is safe
 RATE_LIMIT_PAUSE = 10.0  # seconds to wait when SAM.gov returns 429
+PAGE_CONCURRENCY = 4     # pages in flight per month window (SAM.gov allows 10 req/s)
+SAVE_INTERVAL = 1.0      # min seconds between per-page state writes
+UPSERT_BATCH = 500       # rows buffered per INSERT ... ON CONFLICT statement
+
+# One pooled client is shared by every month of a run so TCP+TLS to
+# api.sam.gov is negotiated once; HTTP/2 multiplexes page requests over it.
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
 
 # Module-level flag so we never run two backfills in parallel
 _running: bool = False
+_last_save_at: float = 0.0
+_SAVE_LOCK = asyncio.Lock()  # serializes writers sharing the .tmp path
+
+# In-memory mirror of the state file for the status endpoint. Updated on every
+# save; reloaded only when the file's mtime shows someone else wrote it.
+_STATE_CACHE: dict | None = None
+_STATE_MTIME: float | None = None
 
 
 def load_state() -> dict:
     if _STATE_FILE.exists():
         try:
-            with open(_STATE_FILE) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
+            with open(_STATE_FILE, "rb") as f:
+                return orjson.loads(f.read())
+        except (orjson.JSONDecodeError, OSError):
             pass
     return _default_state()
 
@@ -62,15 +80,61 @@ def _default_state() -> dict:
     }
 
 
-def _save_state(state: dict) -> None:
+def _write_state(payload: bytes) -> None:
+    """Write serialized state via tmp file + rename so a crash never leaves a torn file."""
     _STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(_STATE_FILE, "w") as f:
-        json.dump(state, f, indent=2, default=str)
+    tmp = _STATE_FILE.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, _STATE_FILE)
+
+
+async def _save_state(state: dict) -> None:
+    """
+    Persist state without blocking the event loop.
+
+    Serialization happens on the loop (so concurrent page tasks can't mutate
+    the dict mid-dump); the write/fsync/rename runs in a worker thread.
+    """
+    global _last_save_at
+    payload = orjson.dumps(state, default=str, option=orjson.OPT_INDENT_2)
+    async with _SAVE_LOCK:
+        await asyncio.to_thread(_write_state, payload)
+        _last_save_at = time.monotonic()
+        _cache_state(state)
+
+
+async def _maybe_save_state(state: dict, force: bool = False) -> None:
+    """Save state at most once per SAVE_INTERVAL unless forced."""
+    if force or time.monotonic() - _last_save_at > SAVE_INTERVAL:
+        await _save_state(state)
+
+
+def _state_mtime() -> float | None:
+    try:
+        return _STATE_FILE.stat().st_mtime
+    except OSError:
+        return None
+
+
+def _cache_state(state: dict) -> None:
+    global _STATE_CACHE, _STATE_MTIME
+    _STATE_CACHE = state
+    _STATE_MTIME = _state_mtime()
+
+
+def _current_state() -> dict:
+    """Return the cached state, re-reading the file only if it changed on disk."""
+    if _STATE_CACHE is None or _state_mtime() != _STATE_MTIME:
+        _cache_state(load_state())
+    return _STATE_CACHE
 
 
 def get_status() -> dict:
     """Return backfill progress (for the status endpoint)."""
-    state = load_state()
+    state = _current_state()
     months_req = state.get("months_requested", 0)
     months_done = len(state.get("months_done", []))
     pct = round(100 * months_done / months_req, 1) if months_req else 0
@@ -93,8 +157,9 @@ async def run_backfill(months: int, resume: bool = True) -> None:
     """
     Background coroutine — fetch months of SAM.gov history and upsert to DB.
 
-    Processes one calendar month at a time, newest-first. On 429 pauses
-    RATE_LIMIT_PAUSE seconds then retries the same page. On any other error
+    Processes one calendar month at a time, newest-first. On 429 pauses for
+    the server's Retry-After (or exponential backoff from RATE_LIMIT_PAUSE)
+    then retries the same page. On any other error
     logs and skips the page.
 
     Args:
@@ -109,20 +174,27 @@ async def run_backfill(months: int, resume: bool = True) -> None:
         return
     _running = True
 
-    state = load_state() if resume else _default_state()
+    state = await asyncio.to_thread(load_state) if resume else _default_state()
     state["status"] = "running"
     state["months_requested"] = months
     state["started_at"] = state.get("started_at") or datetime.utcnow().isoformat()
     state["last_error"] = None
-    _save_state(state)
+    await _save_state(state)
 
     try:
         await _do_backfill(months, state)
+    except asyncio.CancelledError:
+        # Cancelled via DELETE /scout/backfill — keep progress so resume works
+        logger.info("Backfill: cancelled")
+        state["status"] = "paused"
+        state["last_error"] = "Cancelled by request"
+        await _save_state(state)
+        raise
     except Exception as e:
         logger.error(f"Backfill: fatal error: {e}")
         state["status"] = "error"
         state["last_error"] = str(e)
-        _save_state(state)
+        await _save_state(state)
     finally:
         _running = False
 
@@ -137,55 +209,68 @@ async def _do_backfill(months: int, state: dict) -> None:
     now = datetime.utcnow()
     windows = []
     for i in range(months):
-        month_start = (now.replace(day=1) - timedelta(days=i * 30)).replace(day=1)
+        month_start = _shift_month(now, -i)
         # Last day of that calendar month
-        next_month = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1)
-        month_end = next_month - timedelta(days=1)
+        month_end = _shift_month(month_start, 1) - timedelta(days=1)
         key = month_start.strftime("%Y-%m")
         windows.append((key, month_start, min(month_end, now)))
 
+    # Drop finished months, and anything newer than the resume point, up front
     resume_month = state.get("resume_month")
-
-    for key, win_start, win_end in windows:
-        if key in done_months:
-            logger.info(f"Backfill: skipping already-done month {key}")
-            continue
-
-        # If resuming, skip until we hit the resume_month
-        if resume_month and key != resume_month and key not in done_months:
-            # Check if this key is newer than resume_month
-            if key > resume_month:
-                logger.info(f"Backfill: skip {key} (newer than resume point {resume_month})")
-                continue
-
-        state["current_month"] = key
-        state["resume_month"] = key
-        _save_state(state)
-
-        logger.info(f"Backfill: fetching {key} ({win_start.date()} → {win_end.date()})")
-
-        page_upserted = await _fetch_month(sam, win_start, win_end, state)
-
-        done_months.add(key)
-        state["months_done"] = sorted(done_months)
-        state["current_month"] = None
-        _save_state(state)
-        logger.info(f"Backfill: completed {key}, upserted {page_upserted} total for this month")
-
-        # Polite pause between months so we don't hammer SAM.gov
-        await asyncio.sleep(1.0)
+    pending = [
+        w for w in windows
+        if w[0] not in done_months and not (resume_month and w[0] > resume_month)
+    ]
+    if len(pending) < len(windows):
+        logger.info(
+            f"Backfill: skipping {len(windows) - len(pending)} months "
+            f"(done or newer than resume point {resume_month})"
+        )
+
+    # api.sam.gov (an api.data.gov gateway) accepts the key as X-Api-Key, so it
+    # is set once on the client instead of being re-encoded into every URL.
+    async with httpx.AsyncClient(
+        timeout=30.0,
+        limits=_CLIENT_LIMITS,
+        http2=True,
+        headers={"X-Api-Key": sam.api_key},
+    ) as client:
+        for key, win_start, win_end in pending:
+            state["current_month"] = key
+            state["resume_month"] = key
+            await _save_state(state)
+
+            logger.info(f"Backfill: fetching {key} ({win_start.date()} → {win_end.date()})")
+
+            page_upserted = await _fetch_month(client, sam, win_start, win_end, state)
+
+            done_months.add(key)
+            state["months_done"] = sorted(done_months)
+            state["current_month"] = None
+            await _save_state(state)
+            logger.info(f"Backfill: completed {key}, upserted {page_upserted} total for this month")
+
+            # Polite pause between months so we don't hammer SAM.gov
+            await asyncio.sleep(1.0)
 
     state["status"] = "completed"
     state["completed_at"] = datetime.utcnow().isoformat()
     state["resume_month"] = None
-    _save_state(state)
+    await _save_state(state)
     logger.info(
         f"Backfill: done — {state['total_upserted']} total opportunities upserted "
         f"in {state['total_pages_fetched']} pages"
     )
 
 
+def _shift_month(dt: datetime, delta: int) -> datetime:
+    """First day (00:00) of the calendar month `delta` months from dt's month."""
+    y, m = divmod(dt.year * 12 + dt.month - 1 + delta, 12)
+    return datetime(y, m + 1, 1)
+
+
 async def _fetch_month(
+    client: httpx.AsyncClient,
     sam: SAMGovClient,
     win_start: datetime,
     win_end: datetime,
@@ -193,50 +278,104 @@ async def _fetch_month(
 ) -> int:
     """
     Paginate through one month window. Returns total upserted for this month.
+
+    Pages are requested PAGE_CONCURRENCY at a time; the first empty or short
+    page in a window marks the end of the month. A consumer task buffers the
+    parsed rows and upserts them UPSERT_BATCH at a time over one session for
+    the whole month while the next pages are still being fetched.
     Handles 429 with pause+retry. Other errors skip the page.
     """
     posted_from = win_start.strftime("%m/%d/%Y")
     posted_to = win_end.strftime("%m/%d/%Y")
     month_upserted = 0
-    offset = 0
 
+    # Built once per month; each in-flight page gets its own copy because
+    # retries re-send their params after other pages have moved on.
     base_params = {
-        "api_key": sam.api_key,
         "limit": PAGE_SIZE,
         "postedFrom": posted_from,
         "postedTo": posted_to,
     }
+    sem = asyncio.Semaphore(PAGE_CONCURRENCY)
+
+    async def fetch(page_offset: int) -> list[Opportunity]:
+        async with sem:
+            params = {**base_params, "offset": page_offset}
+            return await _fetch_page_with_retry(client, sam.base_url, params, state)
+
+    # Keyed by notice_id: Postgres rejects ON CONFLICT batches that touch the
+    # same row twice, and pages can overlap when SAM.gov shifts results.
+    buf: dict[str, Opportunity] = {}
+    session = await get_db_session()
+    # Most backfilled months are new to the table, so batches go in via COPY
+    # until one collides with existing rows (a resumed or repeated month);
+    # from then on this month uses the upsert path directly.
+    use_copy = True
+
+    async def flush() -> None:
+        nonlocal month_upserted, use_copy
+        if not buf:
+            return
+        batch = list(buf.values())
+        buf.clear()
+        if use_copy:
+            use_copy = await bulk_insert_opportunities_fast(session, batch)
+        else:
+            await upsert_opportunities(session, batch)
+        state["total_upserted"] += len(batch)
+        month_upserted += len(batch)
+
+    # Fetching and upserting overlap: the producer keeps up to two windows of
+    # pages queued while the consumer writes to the DB. None ends the month.
+    queue: asyncio.Queue[tuple[int, list[Opportunity]] | None] = asyncio.Queue(
+        maxsize=2 * PAGE_CONCURRENCY
+    )
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async def produce_pages() -> None:
+        offset = 0
         while True:
-            params = {**base_params, "offset": offset}
-            page_opps = await _fetch_page_with_retry(client, sam.base_url, params, state)
-
-            if not page_opps:
-                break  # Empty page → done with this month
-
-            session = await get_db_session()
-            if session:
-                try:
-                    await upsert_opportunities(session, page_opps)
-                finally:
-                    await session.close()
-
-            state["total_upserted"] += len(page_opps)
+            offsets = [offset + i * PAGE_SIZE for i in range(PAGE_CONCURRENCY)]
+            pages = await asyncio.gather(*(fetch(o) for o in offsets))
+            for page_offset, page_opps in zip(offsets, pages):
+                if not page_opps:
+                    return  # Empty page → done with this month
+                await queue.put((page_offset, page_opps))
+                if len(page_opps) < PAGE_SIZE:
+                    return  # Partial page → last page of this window
+            offset += PAGE_CONCURRENCY * PAGE_SIZE
+
+    async def produce() -> None:
+        try:
+            await produce_pages()
+        except Exception:
+            await queue.put(None)
+            raise
+        await queue.put(None)
+
+    async def consume() -> None:
+        while (item := await queue.get()) is not None:
+            page_offset, page_opps = item
+            for opp in page_opps:
+                buf[opp.notice_id] = opp
             state["total_pages_fetched"] += 1
-            month_upserted += len(page_opps)
-            _save_state(state)
+            if len(buf) >= UPSERT_BATCH:
+                await flush()
+            await _maybe_save_state(state)
 
             logger.info(
-                f"Backfill: offset={offset}, page={len(page_opps)}, "
+                f"Backfill: offset={page_offset}, page={len(page_opps)}, "
                 f"total_upserted={state['total_upserted']}"
             )
+        await flush()
 
-            if len(page_opps) < PAGE_SIZE:
-                break  # Partial page → last page of this window
-
-            offset += PAGE_SIZE
-            await asyncio.sleep(0.2)  # Polite crawl within a month
+    producer = asyncio.create_task(produce())
+    try:
+        await consume()
+        await producer
+    finally:
+        producer.cancel()  # no-op once finished; stops fetching if consume failed
+        if session:
+            await session.close()
 
     return month_upserted
 
@@ -253,22 +392,18 @@ async def _fetch_page_with_retry(
         try:
             resp = await client.get(base_url, params=params)
             if resp.status_code == 429:
-                wait = RATE_LIMIT_PAUSE * (attempt + 1)
-                logger.warning(f"Backfill: SAM.gov 429 — pausing {wait}s (attempt {attempt+1})")
+                wait = _retry_after(resp) or RATE_LIMIT_PAUSE * (2 ** attempt)
+                wait += random.uniform(0, 1.0)  # de-sync concurrent page retries
+                logger.warning(f"Backfill: SAM.gov 429 — pausing {wait:.1f}s (attempt {attempt+1})")
                 state["status"] = "paused"
-                _save_state(state)
+                await _save_state(state)
                 await asyncio.sleep(wait)
                 state["status"] = "running"
-                _save_state(state)
+                await _save_state(state)
                 continue
             resp.raise_for_status()
-            raw_items = resp.json().get("opportunitiesData", [])
-            opps = []
-            for item in raw_items:
-                opp = _parse_raw(item)
-                if opp:
-                    opps.append(opp)
-            return opps
+            raw_items = orjson.loads(resp.content).get("opportunitiesData", [])
+            return [o for o in (_parse_raw(item) for item in raw_items) if o]
         except httpx.HTTPStatusError as e:
             logger.warning(f"Backfill: HTTP {e.response.status_code} on page — skipping")
             return []
@@ -280,11 +415,24 @@ async def _fetch_page_with_retry(
     return []
 
 
+def _retry_after(resp: httpx.Response) -> float:
+    """Seconds from a Retry-After header (delta-seconds form), or 0 if absent/unparseable."""
+    try:
+        return max(float(resp.headers.get("Retry-After", 0)), 0.0)
+    except ValueError:
+        return 0.0
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> SAMGovClient:
+    """Single SAMGovClient whose parser is shared by every page of a run."""
+    return SAMGovClient()
+
+
 def _parse_raw(raw: dict) -> Optional[Opportunity]:
-    """Reuse SAMGovClient's parser without instantiating the full client."""
+    """Reuse SAMGovClient's parser without instantiating a client per item."""
     try:
-        client = SAMGovClient()
-        return client._parse_opportunity(raw)
+        return _get_parser()._parse_opportunity(raw)
     except Exception as e:
         logger.debug(f"Backfill: failed to parse opportunity: {e}")
         return None
@@ -8,7 +8,7 @@ import asyncio
 import logging
 from datetime import datetime, timezone
 
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.core.config import get_settings
@@ -16,11 +16,11 @@ from app.core.config import get_settings
 logger = logging.getLogger(__name__)
 
 # Module-level scheduler instance — shared with the status endpoint
-_scheduler: BackgroundScheduler | None = None
+_scheduler: AsyncIOScheduler | None = None
 _last_result: dict | None = None
 
 
-def get_scheduler() -> BackgroundScheduler | None:
+def get_scheduler() -> AsyncIOScheduler | None:
     return _scheduler
 
 
@@ -28,27 +28,24 @@ def get_last_result() -> dict | None:
     return _last_result
 
 
-def _run_scout_job(clusters_getter, profile_getter) -> None:
+async def _run_scout_job(clusters_getter, profile_getter) -> None:
     """
-    Synchronous wrapper executed by APScheduler's background thread.
+    Scout job coroutine, awaited by AsyncIOScheduler on the FastAPI event loop.
 
-    APScheduler uses threads, not asyncio, so we spin up a new event loop
-    for the async Scout agent.
+    Running on the live loop (rather than a fresh loop per run on a worker
+    thread) keeps connection pools and clients warm between scans.
     """
     global _last_result
     from app.agents.scout import ScoutAgent
     from app.services.email_alerts import send_opportunity_digest
 
-    clusters = clusters_getter()
-    profile = profile_getter()
-
-    agent = ScoutAgent()
-
-    async def _async_run():
-        global _last_result
+    try:
+        clusters = clusters_getter()
+        profile = profile_getter()
         agency_prefs = profile.agency_preferences if profile else []
         geo_prefs = profile.geographic_preferences if profile else []
 
+        agent = ScoutAgent()
         result = await agent.run(
             clusters=clusters,
             agency_preferences=agency_prefs,
@@ -70,22 +67,15 @@ def _run_scout_job(clusters_getter, profile_getter) -> None:
             f"{len(new_opps)} new above threshold, "
             f"{'email sent' if alerts_sent else 'no email'}"
         )
-        return result
-
-    try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(_async_run())
-        finally:
-            loop.close()
     except Exception as e:
         logger.error(f"Scout job failed: {e}", exc_info=True)
 
 
-def start_scheduler(clusters_getter, profile_getter) -> BackgroundScheduler:
+def start_scheduler(clusters_getter, profile_getter) -> AsyncIOScheduler:
     """
-    Create and start the APScheduler BackgroundScheduler.
+    Create and start the APScheduler AsyncIOScheduler.
+
+    Must be called from within the running event loop (FastAPI lifespan).
 
     Args:
         clusters_getter: Callable[[], list[CapabilityCluster]] — returns current clusters.
@@ -97,7 +87,7 @@ def start_scheduler(clusters_getter, profile_getter) -> BackgroundScheduler:
     settings = get_settings()
     interval_hours = settings.scout_interval_hours
 
-    _scheduler = BackgroundScheduler(timezone="UTC")
+    _scheduler = AsyncIOScheduler(timezone="UTC", event_loop=asyncio.get_running_loop())
     _scheduler.add_job(
         func=_run_scout_job,
         trigger=IntervalTrigger(hours=interval_hours),
@@ -3,18 +3,25 @@ Scout Agent — Agent 1 in the autonomous contract pursuit pipeline.
 
 Scans SAM.gov + SubNet every 6 hours for new opportunities, scores them
 against all saved capability clusters, and returns high-scoring new matches.
-State (last_run_at, seen notice_ids) is persisted to backend/data/scout_state.json.
+State is persisted under backend/data/: the small mutable pointer
+(last_run_at) in scout_state.json, and the growing history — seen notice_ids
+and per-run records — in append-only scout_seen_ids.jsonl / scout_runs.jsonl.
 """
 import asyncio
-import json
+import functools
 import logging
+import multiprocessing
 import os
-from datetime import datetime, timedelta
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import orjson
+
 from app.core.config import get_settings
 from app.models.schemas import (
-    CapabilityCluster, ScoredOpportunity, SearchFilters,
+    CapabilityCluster, MatchScore, ScoredOpportunity, SearchFilters,
 )
 from app.services.sam_api import SAMGovClient
 from app.services.subnet_client import SubNetClient
@@ -25,24 +32,220 @@ logger = logging.getLogger(__name__)
 
 # Default state file path — relative to the backend/ working directory
 _STATE_FILE = Path(__file__).parent.parent.parent / "data" / "scout_state.json"
+_SEEN_FILE = _STATE_FILE.with_name("scout_seen_ids.jsonl")
+_RUNS_FILE = _STATE_FILE.with_name("scout_runs.jsonl")
+
+# Scoring is pure-Python, GIL-bound work — run it in worker processes so the
+# event loop (and the AsyncIOScheduler jobs on it) stays responsive during a
+# scan. Workers are spawned, not forked: by the first scan this process already
+# runs to_thread workers, and forking a multi-threaded process can deadlock.
+_SCORER_POOL = ProcessPoolExecutor(
+    max_workers=2, mp_context=multiprocessing.get_context("spawn"),
+)
+
+SEEN_CAP = 10_000  # max notice_ids remembered for deduplication
+RUNS_CAP = 100     # run records kept
+
+# In-process mirror of state["seen_notice_ids"]: the deque keeps insertion
+# order for FIFO eviction, the set gives O(1) membership. Loaded on first run.
+_SEEN_DEQUE: deque[str] | None = None
+_SEEN_SET: set[str] = set()
+# State dict of the current/last run — its runs deque and last_run_at are
+# updated in place, so the status endpoint can read it without touching disk
+_STATE: dict | None = None
+
 
+def shutdown_scorer_pool() -> None:
+    """Stop the scoring worker processes (blocking — call on app shutdown)."""
+    _SCORER_POOL.shutdown(wait=True, cancel_futures=True)
 
-def _load_state() -> dict:
-    """Load persisted Scout state from disk. Returns empty state if missing."""
+
+def _read_jsonl_tail(path: Path, cap: int) -> tuple[deque, int, int]:
+    """
+    Stream a JSONL file, keeping the last `cap` records.
+
+    Returns (tail, line_count, bad_lines). A line that doesn't decode — e.g. a
+    record torn by a crash mid-append — is skipped and counted, so the records
+    after it still load and the caller can compact the bad line away.
+    """
+    tail: deque = deque(maxlen=cap)
+    count = bad = 0
+    if path.exists():
+        try:
+            with open(path, "rb") as f:
+                for lineno, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    count += 1
+                    try:
+                        tail.append(orjson.loads(line))
+                    except orjson.JSONDecodeError as e:
+                        bad += 1
+                        logger.warning(f"Scout: skipping corrupt line {lineno} in {path.name} ({e})")
+        except OSError as e:
+            logger.warning(f"Scout: could not read {path.name} ({e}), keeping {len(tail)} records")
+    return tail, count, bad
+
+
+def _append_jsonl(path: Path, records: list) -> None:
+    """Append one JSON line per record."""
+    if not records:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        # A crash mid-append can leave a torn last line with no newline —
+        # terminate it so the new records don't get glued onto it
+        if f.seek(0, os.SEEK_END):
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.writelines(orjson.dumps(r, default=str) + b"\n" for r in records)
+
+
+def _rewrite_jsonl(path: Path, records: list) -> None:
+    """Atomically replace a JSONL file (used for compaction and migration)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.writelines(orjson.dumps(r, default=str) + b"\n" for r in records)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _load_state(compact: bool = False, migrate: bool = True) -> dict:
+    """
+    Load persisted Scout state from disk. Returns empty state if missing.
+
+    The returned dict keeps its historical keys (last_run_at, seen_notice_ids,
+    runs); the two history keys hold capped deques. Pre-JSONL state files are
+    migrated on first load (migrate=False reads the legacy lists without
+    writing anything). With compact=True, history files that have grown past
+    twice their cap or contain corrupt lines are rewritten.
+    """
+    state: dict = {"last_run_at": None}
     if _STATE_FILE.exists():
         try:
-            with open(_STATE_FILE) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
+            with open(_STATE_FILE, "rb") as f:
+                state = orjson.loads(f.read())
+        except (orjson.JSONDecodeError, OSError) as e:
             logger.warning(f"Scout: could not read state file ({e}), starting fresh")
-    return {"last_run_at": None, "seen_notice_ids": [], "runs": []}
+
+    for key, path, cap in (
+        ("seen_notice_ids", _SEEN_FILE, SEEN_CAP),
+        ("runs", _RUNS_FILE, RUNS_CAP),
+    ):
+        legacy = state.pop(key, None)
+        if legacy and key == "runs":
+            for record in legacy:
+                _normalize_run_at(record)
+        if legacy and not path.exists():
+            if not migrate:
+                state[key] = deque(legacy[-cap:], maxlen=cap)
+                continue
+            _rewrite_jsonl(path, legacy[-cap:])
+        tail, count, bad = _read_jsonl_tail(path, cap)
+        if compact and (bad or count > 2 * cap):
+            _rewrite_jsonl(path, list(tail))
+        state[key] = tail
+    # Files migrated before run_at was normalised may still hold ISO strings
+    for record in state["runs"]:
+        _normalize_run_at(record)
+    return state
+
+
+def _normalize_run_at(record: dict) -> None:
+    """Convert a legacy ISO run_at (naive UTC) to epoch seconds, in place."""
+    run_at = record.get("run_at")
+    if isinstance(run_at, str):
+        try:
+            dt = datetime.fromisoformat(run_at)
+        except ValueError:
+            return
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        record["run_at"] = int(dt.timestamp())
 
 
 def _save_state(state: dict) -> None:
-    """Persist Scout state to disk."""
+    """Persist the mutable Scout pointers atomically (tmp file + rename)."""
+    pointers = {k: v for k, v in state.items() if k not in ("seen_notice_ids", "runs")}
     _STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(_STATE_FILE, "w") as f:
-        json.dump(state, f, indent=2, default=str)
+    tmp = _STATE_FILE.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(pointers, default=str, option=orjson.OPT_INDENT_2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, _STATE_FILE)
+
+
+def _persist_run(state: dict, added_ids: list[str], run_record: dict) -> None:
+    """Write the pointer file and append this run's history (blocking file I/O)."""
+    _save_state(state)
+    _append_jsonl(_SEEN_FILE, added_ids)
+    _append_jsonl(_RUNS_FILE, [run_record])
+
+
+def _seen_index(state: dict) -> deque[str]:
+    """Return the seen-ids deque, building it (and _SEEN_SET) from state once."""
+    global _SEEN_DEQUE, _SEEN_SET
+    if _SEEN_DEQUE is None:
+        _SEEN_DEQUE = deque(state.get("seen_notice_ids", []), maxlen=SEEN_CAP)
+        _SEEN_SET = set(_SEEN_DEQUE)
+    return _SEEN_DEQUE
+
+
+def _mark_seen(notice_id: str) -> bool:
+    """Record a notice_id, evicting the oldest once SEEN_CAP is reached. True if new."""
+    if notice_id in _SEEN_SET:
+        return False
+    if len(_SEEN_DEQUE) == SEEN_CAP:
+        _SEEN_SET.discard(_SEEN_DEQUE[0])
+    _SEEN_SET.add(notice_id)
+    _SEEN_DEQUE.append(notice_id)
+    return True
+
+
+def _unseen(opportunities: list, taken: set[str]) -> list:
+    """Drop previously seen and already-taken notice_ids (first one wins); updates taken."""
+    fresh = []
+    for opp in opportunities:
+        nid = opp.notice_id
+        if nid in _SEEN_SET or nid in taken:
+            continue
+        taken.add(nid)
+        fresh.append(opp)
+    return fresh
+
+
+def _score(
+    opportunities: list,
+    clusters: list[CapabilityCluster],
+    agency_preferences: list[str],
+    geographic_preferences: list[str],
+) -> list[ScoredOpportunity]:
+    """Score a batch against all clusters. Top-level so it pickles into _SCORER_POOL."""
+    if not opportunities:
+        return []
+    if clusters:
+        return MatchingEngine().score_opportunities_with_clusters(
+            opportunities,
+            clusters,
+            agency_preferences=agency_preferences,
+            geographic_preferences=geographic_preferences,
+        )
+    # No clusters yet — return all fetched without scoring (one shared zero score)
+    unscored = MatchScore(
+        overall_score=0, naics_score=0, set_aside_score=0,
+        agency_score=0, geo_score=0, semantic_score=0,
+        explanation="No clusters configured",
+    )
+    return [
+        ScoredOpportunity.model_construct(
+            opportunity=opp, match_score=unscored, match_tier="unscored",
+        )
+        for opp in opportunities
+    ]
 
 
 class ScoutAgent:
@@ -82,8 +285,10 @@ class ScoutAgent:
               - run_at: str (ISO timestamp)
               - posted_from: str  (window start)
         """
+        global _STATE
         run_at = datetime.utcnow()
-        state = _load_state()
+        state = await asyncio.to_thread(_load_state, True)
+        _STATE = state
 
         # Determine fetch window — start from last run or 24h ago (first run)
         if state.get("last_run_at"):
@@ -106,18 +311,37 @@ class ScoutAgent:
             limit=100,
         )
 
-        # Fetch SAM.gov + SubNet + state portals in parallel
-        sam_task = self.sam_client.search_opportunities(filters)
-        subnet_task = self.subnet_client.search_opportunities(filters)
-        state_task = fetch_all_state_opportunities()
-
-        sam_results, subnet_results, state_results = await asyncio.gather(
-            sam_task, subnet_task, state_task, return_exceptions=True
+        # Fetch SAM.gov + SubNet + state portals in parallel. SAM.gov usually
+        # answers first, so its batch is scored in _SCORER_POOL while the
+        # slower scrapers are still in flight.
+        loop = asyncio.get_running_loop()
+        sam_task = asyncio.create_task(self.sam_client.search_opportunities(filters))
+        others_task = asyncio.gather(
+            self.subnet_client.search_opportunities(filters),
+            fetch_all_state_opportunities(),
+            return_exceptions=True,
         )
 
-        if isinstance(sam_results, Exception):
-            logger.error(f"Scout: SAM.gov fetch failed: {sam_results}")
+        try:
+            sam_results = await sam_task
+        except Exception as e:
+            logger.error(f"Scout: SAM.gov fetch failed: {e}")
             sam_results = []
+
+        # Only unseen, de-duplicated notices go to the matcher — SAM.gov wins
+        # ties with SubNet/state copies of the same notice_id.
+        _seen_index(state)
+        taken: set[str] = set()
+        agency_prefs = agency_preferences or []
+        geo_prefs = geographic_preferences or []
+        sam_scoring = loop.run_in_executor(
+            _SCORER_POOL,
+            functools.partial(
+                _score, _unseen(sam_results, taken), clusters, agency_prefs, geo_prefs
+            ),
+        )
+
+        subnet_results, state_results = await others_task
         if isinstance(subnet_results, Exception):
             logger.warning(f"Scout: SubNet fetch failed (continuing): {subnet_results}")
             subnet_results = []
@@ -125,51 +349,34 @@ class ScoutAgent:
             logger.warning(f"Scout: state scrapers failed (continuing): {state_results}")
             state_results = []
 
-        all_opportunities = list(sam_results) + list(subnet_results) + list(state_results)
-        total_fetched = len(all_opportunities)
+        other_opportunities = list(subnet_results) + list(state_results)
+        total_fetched = len(sam_results) + len(other_opportunities)
         logger.info(
             f"Scout: fetched {len(sam_results)} SAM + {len(subnet_results)} SubNet "
             f"+ {len(state_results)} state"
         )
 
-        if not all_opportunities:
+        sam_scored = await sam_scoring
+        if not total_fetched:
             self._record_run(state, run_at, total_fetched=0, new_count=0)
             return self._build_result([], 0, 0, run_at, posted_from)
 
-        # Score against all clusters
-        seen_ids: set[str] = set(state.get("seen_notice_ids", []))
-        threshold = self.settings.scout_score_threshold
-
-        if clusters:
-            scored = self.matcher.score_opportunities_with_clusters(
-                all_opportunities,
-                clusters,
-                agency_preferences=agency_preferences or [],
-                geographic_preferences=geographic_preferences or [],
-            )
-        else:
-            # No clusters yet — return all fetched without scoring
-            from app.models.schemas import MatchScore
-            scored = [
-                ScoredOpportunity(
-                    opportunity=opp,
-                    match_score=MatchScore(
-                        overall_score=0, naics_score=0, set_aside_score=0,
-                        agency_score=0, geo_score=0, semantic_score=0,
-                        explanation="No clusters configured",
-                    ),
-                    match_tier="unscored",
-                )
-                for opp in all_opportunities
-            ]
+        other_scored = await loop.run_in_executor(
+            _SCORER_POOL,
+            functools.partial(
+                _score, _unseen(other_opportunities, taken), clusters, agency_prefs, geo_prefs
+            ),
+        )
+        scored = sam_scored + other_scored
+        scored.sort(key=lambda x: x.match_score.overall_score, reverse=True)
 
+        threshold = self.settings.scout_score_threshold
         total_scored = len(scored)
 
-        # Filter: above threshold AND not previously seen
+        # Filter: above threshold (seen notices were dropped before scoring)
         new_opportunities = [
             s for s in scored
             if s.match_score.overall_score >= threshold
-            and s.opportunity.notice_id not in seen_ids
         ]
 
         logger.info(
@@ -178,15 +385,9 @@ class ScoutAgent:
         )
 
         # Persist updated state
-        new_ids = [s.opportunity.notice_id for s in scored]
-        updated_seen = list(seen_ids | set(new_ids))
-        # Cap seen list at 10,000 to avoid unbounded growth
-        if len(updated_seen) > 10_000:
-            updated_seen = updated_seen[-10_000:]
-
-        state["seen_notice_ids"] = updated_seen
-        self._record_run(state, run_at, total_fetched, len(new_opportunities))
-        _save_state(state)
+        added = [s.opportunity.notice_id for s in scored if _mark_seen(s.opportunity.notice_id)]
+        run_record = self._record_run(state, run_at, total_fetched, len(new_opportunities))
+        await asyncio.to_thread(_persist_run, state, added, run_record)
 
         result = self._build_result(
             new_opportunities, total_fetched, total_scored, run_at, posted_from
@@ -241,23 +442,36 @@ class ScoutAgent:
         run_at: datetime,
         total_fetched: int,
         new_count: int,
-    ) -> None:
-        """Update state with latest run metadata."""
+    ) -> dict:
+        """Update state with latest run metadata. Returns the new run record."""
         state["last_run_at"] = run_at.isoformat()
-        runs: list[dict] = state.get("runs", [])
-        runs.append({
-            "run_at": run_at.isoformat(),
+        # run_at is naive UTC; stored as epoch seconds to keep history lines small
+        record = {
+            "run_at": int(run_at.replace(tzinfo=timezone.utc).timestamp()),
             "total_fetched": total_fetched,
             "new_count": new_count,
-        })
-        # Keep last 100 run records
-        state["runs"] = runs[-100:]
+        }
+        # Ring buffer of the last RUNS_CAP records (deque from _load_state)
+        state.setdefault("runs", deque(maxlen=RUNS_CAP)).append(record)
+        return record
 
     def _format_date(self, dt: datetime) -> str:
         """Format date as MM/dd/yyyy for SAM.gov API."""
         return dt.strftime("%m/%d/%Y")
 
     @staticmethod
-    def get_state() -> dict:
-        """Return current persisted state (for the status endpoint)."""
-        return _load_state()
+    async def get_state() -> dict:
+        """
+        Return current Scout state (for the status endpoint).
+
+        Served from memory once a run has loaded the state; before the first
+        run it is read from disk off the event loop, without migrating or
+        compacting anything.
+        """
+        if _STATE is None:
+            return await asyncio.to_thread(_load_state, False, False)
+        return {
+            "last_run_at": _STATE.get("last_run_at"),
+            "runs": _STATE["runs"],
+            "seen_notice_ids": _SEEN_DEQUE if _SEEN_DEQUE is not None else _STATE["seen_notice_ids"],
+        }
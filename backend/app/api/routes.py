@@ -1,24 +1,30 @@
 """API routes for GovContract AI."""
 import asyncio
-import hashlib
-import json
+import heapq
+import itertools
 import logging
 import uuid
+from collections import Counter, OrderedDict, deque
 from datetime import datetime
 from time import monotonic
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import BaseModel, TypeAdapter
 from typing import Optional
 
 from app.models.schemas import (
-    CompanyProfile, CapabilityCluster, SearchFilters,
-    ScoredOpportunity, OpportunityDetail, Pursuit, PursuitStatus,
+    CompanyProfile, CapabilityCluster, ComplexityTier, MatchScore, SearchFilters,
+    Opportunity, ScoredOpportunity, OpportunityDetail, Pursuit, PursuitStatus,
 )
 from app.services.sam_api import SAMGovClient
 from app.services.subnet_client import SubNetClient
 from app.services.matcher import MatchingEngine
 from app.services.analyzer import OpportunityAnalyzer
-from app.core.database import get_db_session
+from app.services.semantic_scorer import SemanticScorer
+from app.services.usaspending_client import USASpendingClient
+from app.services.fpds_client import FPDSClient
+from app.services.proposal_generator import ProposalGenerator
+from app.agents.scout import ScoutAgent
+from app.core.database import db_session
 from app.services.db_ops import (
     upsert_cluster, delete_cluster_from_db, upsert_opportunities,
     upsert_pursuit, delete_pursuit_from_db, get_all_pursuits_from_db,
@@ -28,38 +34,130 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+class _CachedSearch:
+    """
+    One search's results plus the views the detail, proposal, stats and
+    export endpoints read, all derived in one pass when the search finishes.
+    Built whole and swapped in with a single rebind, so readers never see the
+    list and its indexes out of step.
+    """
+
+    def __init__(self, scored: list[ScoredOpportunity]):
+        self.scored = scored
+        self.by_notice_id: dict[str, ScoredOpportunity] = {}
+        cluster_match_counts: Counter[str] = Counter()
+        tier_counts: Counter[ComplexityTier] = Counter()  # enum keys; .value once per tier below
+        by_source: Counter[str] = Counter()
+        match_tier_counts: Counter[str] = Counter()
+        for s in scored:
+            opp = s.opportunity
+            self.by_notice_id[opp.notice_id] = s
+            tier_counts[opp.complexity_tier] += 1
+            by_source[opp.source] += 1
+            match_tier_counts[s.match_tier] += 1
+            if s.best_cluster_name:
+                cluster_match_counts[s.best_cluster_name] += 1
+
+        self.stats = {
+            "cached_opportunities": len(scored),
+            "high_matches": match_tier_counts["high"],
+            "medium_matches": match_tier_counts["medium"],
+            "by_source": dict(by_source),
+            "by_complexity_tier": {tier.value: n for tier, n in tier_counts.items()},
+            "by_cluster": dict(cluster_match_counts),
+        }
+
+
 # In-memory store for V1 (Supabase in V2)
+#
+# Concurrency contract: these module-level stores (and the search caches below)
+# are only touched from coroutines on the single event loop — never from worker
+# threads or processes. Every read-modify-write sequence on them runs without
+# an intervening `await` (DB writes are spawned *after* the mutation), so it is
+# atomic with respect to other requests and needs no locks. Keep it that way:
+# don't await between reading an entry and writing it back.
+#
+# The stores are per-process. Run a single uvicorn worker: clusters and
+# pursuits are reloaded from the DB at startup, but profiles, the search caches
+# and the Scout scheduler live only here, so extra workers would each see (and
+# schedule) their own copy. Scale-out means moving these to shared storage.
 _profiles: dict[str, CompanyProfile] = {}
 _clusters: dict[str, CapabilityCluster] = {}
-_cached_opportunities: list[ScoredOpportunity] = []
+_cached_search = _CachedSearch([])  # last search's results; see _remember_results
+# A few recent result sets stay reachable for detail/proposal lookups, so one
+# user's search doesn't strand another's open results. Bounded by count.
+RECENT_SEARCHES_MAX = 8
+_recent_searches: deque[_CachedSearch] = deque(maxlen=RECENT_SEARCHES_MAX)
+# Kept in updated_at order (oldest → newest): every write re-inserts at the
+# end, so listing newest-first is a reversed walk rather than a sort.
 _pursuits: dict[str, Pursuit] = {}
 
 sam_client = SAMGovClient()
 subnet_client = SubNetClient()
+semantic_scorer = SemanticScorer()
+usaspending_client = USASpendingClient()
+fpds_client = FPDSClient()
+proposal_generator = ProposalGenerator()
+scout_agent = ScoutAgent()
 matcher = MatchingEngine()
 analyzer = OpportunityAnalyzer()
 
 # --- Search result cache (raw opportunities, before scoring) ---
-# Keyed by a hash of search params. Evicted after SEARCH_CACHE_TTL seconds.
+# Keyed by a tuple of search params. Evicted after SEARCH_CACHE_TTL seconds,
+# or least-recently-used first once SEARCH_CACHE_MAX keys are held.
 SEARCH_CACHE_TTL = 300  # 5 minutes
-_search_cache: dict[str, tuple[float, list]] = {}  # key → (fetched_at, opportunities)
-
-
-def _search_cache_key(filters: SearchFilters, include_subnet: bool) -> str:
-    """Stable MD5 key from the fetch-relevant subset of SearchFilters."""
-    data = {
-        "keywords": filters.keywords,
-        "naics_codes": sorted(filters.naics_codes),
-        "set_aside": filters.set_aside,
-        "posted_from": filters.posted_from,
-        "posted_to": filters.posted_to,
-        "opportunity_types": sorted(filters.opportunity_types),
-        "department": filters.department,
-        "limit": filters.limit,
-        "offset": filters.offset,
-        "include_subnet": include_subnet,
-    }
-    return hashlib.md5(json.dumps(data, sort_keys=True).encode()).hexdigest()
+SEARCH_CACHE_MAX = 256  # distinct fetch-param combinations kept
+_search_cache: OrderedDict[tuple, tuple[float, list]] = OrderedDict()  # key → (fetched_at, opportunities)
+_expiry_heap: list[tuple[float, tuple]] = []  # (expires_at, key) min-heap for eviction
+_inflight_fetches: dict[tuple, asyncio.Task] = {}  # cache key → fetch in progress
+
+# --- Search response cache (scored + serialized) ---
+# Keyed by fetch key + every scoring/filter input. An entry is valid only while
+# the raw entry it was scored from (same fetched_at) is live, and the whole
+# cache is dropped whenever a profile or cluster changes.
+_search_response_cache: OrderedDict[tuple, tuple[float, list[ScoredOpportunity], bytes]] = OrderedDict()
+_search_response_generation = 0  # bumped on every drop; see _invalidate_search_responses
+
+
+def _invalidate_search_responses() -> None:
+    """Drop cached responses after a profile/cluster change.
+
+    Scoring runs off the event loop, so a search may finish after the change it
+    raced with; it compares generations and skips caching a stale result.
+    """
+    global _search_response_generation
+    _search_response_cache.clear()
+    _search_response_generation += 1
+
+
+_scored_list_adapter = TypeAdapter(list[ScoredOpportunity])
+
+# List endpoints return models built from trusted in-memory state, so they are
+# dumped straight to JSON bytes instead of being re-validated against
+# response_model (which is still declared on the route for the OpenAPI schema).
+_profile_list_adapter = TypeAdapter(list[CompanyProfile])
+_cluster_list_adapter = TypeAdapter(list[CapabilityCluster])
+_pursuit_list_adapter = TypeAdapter(list[Pursuit])
+
+
+def _json_response(adapter: TypeAdapter, value) -> Response:
+    return Response(content=adapter.dump_json(value), media_type="application/json")
+
+
+def _search_cache_key(filters: SearchFilters, include_subnet: bool) -> tuple:
+    """Hashable key from the fetch-relevant subset of SearchFilters."""
+    return (
+        filters.keywords,
+        filters.naics_codes,
+        filters.set_aside,
+        filters.posted_from,
+        filters.posted_to,
+        filters.opportunity_types,
+        filters.department,
+        filters.limit,
+        filters.offset,
+        include_subnet,
+    )
 
 
 # --- Company Profile ---
@@ -68,8 +166,9 @@ def _search_cache_key(filters: SearchFilters, include_subnet: bool) -> str:
 async def create_or_update_profile(profile: CompanyProfile):
     """Create or update the user's company profile."""
     if not profile.id:
-        profile.id = str(uuid.uuid4())
+        profile.id = uuid.uuid4().hex
     _profiles[profile.id] = profile
+    _invalidate_search_responses()
     logger.info(f"Profile saved: {profile.company_name} ({profile.id})")
     return profile
 
@@ -85,29 +184,41 @@ async def get_profile(profile_id: str):
 @router.get("/profiles", tags=["Profiles"], response_model=list[CompanyProfile])
 async def list_profiles():
     """List all profiles (V1: small scale, no auth)."""
-    return list(_profiles.values())
+    return _json_response(_profile_list_adapter, list(_profiles.values()))
+
+
+# --- Background DB writes ---
+# Handlers update the in-memory stores and return immediately; DB persistence
+# runs as a task. Strong refs live here until completion so tasks aren't GC'd.
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _log_task_error(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.warning(f"Background DB write failed (non-critical): {task.exception()}")
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Schedule a fire-and-forget coroutine, logging (not raising) its errors."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_log_task_error)
+    return task
 
 
 # --- Capability Clusters ---
 
 async def _db_upsert_cluster(cluster: CapabilityCluster) -> None:
     """Fire-and-forget cluster upsert to DB. Errors are logged, not raised."""
-    session = await get_db_session()
-    if session:
-        try:
-            await upsert_cluster(session, cluster)
-        finally:
-            await session.close()
+    async with db_session() as session:
+        await upsert_cluster(session, cluster)
 
 
 async def _db_delete_cluster(cluster_id: str) -> None:
     """Fire-and-forget cluster delete from DB."""
-    session = await get_db_session()
-    if session:
-        try:
-            await delete_cluster_from_db(session, cluster_id)
-        finally:
-            await session.close()
+    async with db_session() as session:
+        await delete_cluster_from_db(session, cluster_id)
 
 
 @router.post("/clusters", tags=["Clusters"], response_model=CapabilityCluster)
@@ -122,9 +233,10 @@ async def create_cluster(cluster: CapabilityCluster):
     the best-matching cluster.
     """
     if not cluster.id:
-        cluster.id = str(uuid.uuid4())
+        cluster.id = uuid.uuid4().hex
     _clusters[cluster.id] = cluster
-    await _db_upsert_cluster(cluster)
+    _invalidate_search_responses()
+    _spawn(_db_upsert_cluster(cluster))
     logger.info(f"Cluster created: {cluster.name} ({cluster.id})")
     return cluster
 
@@ -140,7 +252,7 @@ async def get_cluster(cluster_id: str):
 @router.get("/clusters", tags=["Clusters"], response_model=list[CapabilityCluster])
 async def list_clusters():
     """List all capability clusters."""
-    return list(_clusters.values())
+    return _json_response(_cluster_list_adapter, list(_clusters.values()))
 
 
 @router.put("/clusters/{cluster_id}", tags=["Clusters"], response_model=CapabilityCluster)
@@ -150,7 +262,8 @@ async def update_cluster(cluster_id: str, cluster: CapabilityCluster):
         raise HTTPException(status_code=404, detail="Cluster not found")
     cluster.id = cluster_id
     _clusters[cluster_id] = cluster
-    await _db_upsert_cluster(cluster)
+    _invalidate_search_responses()
+    _spawn(_db_upsert_cluster(cluster))
     return cluster
 
 
@@ -160,12 +273,132 @@ async def delete_cluster(cluster_id: str):
     if cluster_id not in _clusters:
         raise HTTPException(status_code=404, detail="Cluster not found")
     del _clusters[cluster_id]
-    await _db_delete_cluster(cluster_id)
+    _invalidate_search_responses()
+    _spawn(_db_delete_cluster(cluster_id))
     return {"deleted": cluster_id}
 
 
 # --- Opportunity Search & Matching ---
 
+# Opportunity upserts go through a queue drained by one long-lived worker, so
+# a burst of searches collapses into a single chunked upsert (upsert_opportunities
+# dedupes by notice_id). Created lazily so the queue binds to the running loop;
+# stop_upsert_worker() flushes what's queued on shutdown.
+UPSERT_COALESCE_WINDOW = 0.05  # seconds to gather more batches before writing
+_upsert_queue: Optional[asyncio.Queue] = None
+_upsert_task: Optional[asyncio.Task] = None
+
+
+def _queue_opportunity_upsert(opportunities: list[Opportunity]) -> None:
+    """Hand fetched opportunities to the DB writer without awaiting it."""
+    global _upsert_queue, _upsert_task
+    if _upsert_queue is None:
+        _upsert_queue = asyncio.Queue()
+        _upsert_task = _spawn(_upsert_worker(_upsert_queue))
+    _upsert_queue.put_nowait(opportunities)
+
+
+async def stop_upsert_worker() -> None:
+    """Write any queued opportunities and stop the DB writer (call before close_db)."""
+    global _upsert_queue, _upsert_task
+    if _upsert_queue is None:
+        return
+    queue, task = _upsert_queue, _upsert_task
+    _upsert_queue = _upsert_task = None
+    queue.put_nowait(None)  # sentinel — the worker flushes its batch, then returns
+    await task
+
+
+async def _upsert_worker(queue: asyncio.Queue) -> None:
+    stopping = False
+    while not stopping:
+        item = await queue.get()
+        if item is None:
+            return
+        batch = list(item)
+        await asyncio.sleep(UPSERT_COALESCE_WINDOW)
+        while not queue.empty():
+            item = queue.get_nowait()
+            if item is None:
+                stopping = True
+            else:
+                batch.extend(item)
+        try:
+            async with db_session() as session:
+                await upsert_opportunities(session, batch)
+        except Exception as e:
+            logger.warning(f"Background DB write failed (non-critical): {e}")
+
+
+# Shared by every unscored result; never mutated (enrichment needs a profile/cluster)
+_UNSCORED_MATCH = MatchScore(
+    overall_score=0, naics_score=0, set_aside_score=0,
+    agency_score=0, geo_score=0, semantic_score=0,
+    explanation="No profile or clusters selected for matching",
+)
+
+
+async def _fetch_opportunities(
+    cache_key: tuple, filters: SearchFilters, include_subnet: bool,
+) -> list[Opportunity]:
+    """Fetch SAM.gov (+ SubNet), merge, and populate the search cache."""
+    # --- Fetch SAM.gov and SubNet in parallel ---
+    # Both sources degrade independently: failures log a warning and return [].
+    # sam_client.search_opportunities() now returns [] on any error instead of
+    # raising, so sam_results / subnet_results should never be exceptions here.
+    # The isinstance guards below are a last-resort safety net.
+    try:
+        if include_subnet:
+            sam_results, subnet_results = await asyncio.gather(
+                sam_client.search_opportunities(filters),
+                subnet_client.search_opportunities(filters),
+                return_exceptions=True,
+            )
+        else:
+            # SAM.gov only — await it directly, no placeholder to gather with
+            sam_results, subnet_results = await sam_client.search_opportunities(filters), []
+    except Exception as e:
+        logger.error(f"Unexpected error during opportunity fetch: {e}")
+        sam_results, subnet_results = [], []
+
+    if isinstance(sam_results, Exception):
+        logger.warning(f"SAM.gov fetch failed (continuing with SubNet only): {sam_results}")
+        sam_results = []
+    if isinstance(subnet_results, Exception):
+        logger.warning(f"SubNet fetch failed (continuing with SAM.gov only): {subnet_results}")
+        subnet_results = []
+
+    # Merge by notice_id so cross-listed notices are scored once (SAM.gov wins)
+    merged = {opp.notice_id: opp for opp in sam_results}
+    for opp in subnet_results:
+        merged.setdefault(opp.notice_id, opp)
+    opportunities = list(merged.values())
+    logger.info(
+        f"Fetched {len(sam_results)} SAM.gov + {len(subnet_results)} SubNet opportunities"
+    )
+
+    # Populate cache (only when at least one source returned results)
+    if opportunities:
+        now = monotonic()
+        _search_cache[cache_key] = (now, opportunities)
+        _search_cache.move_to_end(cache_key)
+        while len(_search_cache) > SEARCH_CACHE_MAX:
+            _search_cache.popitem(last=False)
+        heapq.heappush(_expiry_heap, (now + SEARCH_CACHE_TTL, cache_key))
+        # Evict entries older than TTL to bound memory use. Only heap heads
+        # that have expired are touched; a stale heap entry for a key that
+        # was since refreshed is skipped.
+        while _expiry_heap and _expiry_heap[0][0] <= now:
+            _, k = heapq.heappop(_expiry_heap)
+            entry = _search_cache.get(k)
+            if entry and now - entry[0] >= SEARCH_CACHE_TTL:
+                del _search_cache[k]
+        # Persist to DB (non-blocking — errors never surface to caller)
+        _queue_opportunity_upsert(opportunities)
+
+    return opportunities
+
+
 @router.post("/opportunities/search", tags=["Search"], response_model=list[ScoredOpportunity])
 async def search_opportunities(
     filters: SearchFilters,
@@ -211,65 +444,39 @@ async def search_opportunities(
     cache_key = _search_cache_key(filters, include_subnet)
     now = monotonic()
     cached_entry = _search_cache.get(cache_key)
+    response_key = (
+        cache_key, profile_id, tuple(sorted(cluster_ids)), enrich,
+        filters.min_score, filters.complexity_tiers,
+    )
     if cached_entry and (now - cached_entry[0]) < SEARCH_CACHE_TTL:
+        _search_cache.move_to_end(cache_key)
+        cached_response = _search_response_cache.get(response_key)
+        if cached_response and cached_response[0] == cached_entry[0]:
+            _search_response_cache.move_to_end(response_key)
+            _remember_results(cached_response[1])
+            logger.info(f"Response cache hit: {len(cached_response[1])} scored opportunities")
+            return Response(content=cached_response[2], media_type="application/json")
         age = int(now - cached_entry[0])
         opportunities = cached_entry[1]
         logger.info(f"Cache hit: {len(opportunities)} opportunities (age {age}s)")
     else:
-        # --- Fetch SAM.gov and SubNet in parallel ---
-        # Both sources degrade independently: failures log a warning and return [].
-        # sam_client.search_opportunities() now returns [] on any error instead of
-        # raising, so sam_results / subnet_results should never be exceptions here.
-        # The isinstance guards below are a last-resort safety net.
-        try:
-            sam_task = sam_client.search_opportunities(filters)
-            subnet_task = (
-                subnet_client.search_opportunities(filters)
-                if include_subnet
-                else asyncio.sleep(0, result=[])
-            )
-            sam_results, subnet_results = await asyncio.gather(
-                sam_task, subnet_task, return_exceptions=True
-            )
-        except Exception as e:
-            logger.error(f"Unexpected error during opportunity fetch: {e}")
-            sam_results, subnet_results = [], []
-
-        if isinstance(sam_results, Exception):
-            logger.warning(f"SAM.gov fetch failed (continuing with SubNet only): {sam_results}")
-            sam_results = []
-        if isinstance(subnet_results, Exception):
-            logger.warning(f"SubNet fetch failed (continuing with SAM.gov only): {subnet_results}")
-            subnet_results = []
-
-        opportunities = list(sam_results) + list(subnet_results)
-        logger.info(
-            f"Fetched {len(sam_results)} SAM.gov + {len(subnet_results)} SubNet opportunities"
-        )
-
-        # Populate cache (only when at least one source returned results)
-        if opportunities:
-            _search_cache[cache_key] = (now, opportunities)
-            # Evict entries older than TTL to bound memory use
-            expired = [k for k, (t, _) in _search_cache.items() if now - t > SEARCH_CACHE_TTL]
-            for k in expired:
-                del _search_cache[k]
-            # Persist to DB (non-blocking — errors never surface to caller)
-            try:
-                db_session = await get_db_session()
-                if db_session:
-                    try:
-                        await upsert_opportunities(db_session, opportunities)
-                    finally:
-                        await db_session.close()
-            except Exception as e:
-                logger.warning(f"DB opportunity upsert failed (non-critical): {e}")
+        # Identical concurrent misses share one upstream fetch. shield() keeps
+        # a disconnecting client from cancelling the fetch for the others.
+        task = _inflight_fetches.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(_fetch_opportunities(cache_key, filters, include_subnet))
+            _inflight_fetches[cache_key] = task
+            task.add_done_callback(lambda t: _inflight_fetches.pop(cache_key, None))
+        else:
+            logger.info("Joining in-flight fetch for identical search")
+        opportunities = await asyncio.shield(task)
 
     if not opportunities:
         return []
 
     # --- Scoring ---
     profile = _profiles.get(profile_id) if profile_id else None
+    generation = _search_response_generation
 
     if cluster_ids:
         # Cluster-based matching: score against all requested clusters, tag best match
@@ -279,7 +486,9 @@ async def search_opportunities(
                 status_code=404,
                 detail=f"None of the requested cluster_ids were found: {cluster_ids}",
             )
-        scored = matcher.score_opportunities_with_clusters(
+        # CPU-bound; a worker thread keeps the event loop serving other requests
+        scored = await asyncio.to_thread(
+            matcher.score_opportunities_with_clusters,
             opportunities,
             valid_clusters,
             agency_preferences=profile.agency_preferences if profile else [],
@@ -287,18 +496,13 @@ async def search_opportunities(
         )
     elif profile:
         # Classic profile-based matching
-        scored = matcher.score_opportunities(opportunities, profile)
+        scored = await asyncio.to_thread(matcher.score_opportunities, opportunities, profile)
     else:
-        # No scoring context — return unscored results
+        # No scoring context — return unscored results. Inputs are already
+        # validated models, so model_construct skips re-validating each one.
         scored = [
-            ScoredOpportunity(
-                opportunity=opp,
-                match_score={
-                    "overall_score": 0, "naics_score": 0, "set_aside_score": 0,
-                    "agency_score": 0, "geo_score": 0, "semantic_score": 0,
-                    "explanation": "No profile or clusters selected for matching",
-                },
-                match_tier="unscored",
+            ScoredOpportunity.model_construct(
+                opportunity=opp, match_score=_UNSCORED_MATCH, match_tier="unscored",
             )
             for opp in opportunities
         ]
@@ -306,26 +510,56 @@ async def search_opportunities(
     # --- Optional AI semantic enrichment (enrich=true) ---
     # SemanticScorer: scores top-10 by NAICS score, caches in semantic_scores table.
     if enrich and (profile or cluster_ids):
-        from app.services.semantic_scorer import SemanticScorer
-        scorer = SemanticScorer()
-        scored = await scorer.enrich(scored, _clusters, profile)
+        scored = await semantic_scorer.enrich(scored, _clusters, profile)
 
     # --- Post-scoring filters ---
 
-    # Minimum match score
-    if filters.min_score > 0:
-        scored = [s for s in scored if s.match_score.overall_score >= filters.min_score]
+    # Minimum match score + complexity tier filter (empty list = show all),
+    # applied in one pass with the criteria hoisted to locals
+    min_score = filters.min_score
+    tier_set = filters.complexity_tiers or None
+    if min_score > 0 or tier_set is not None:
+        scored = [
+            s for s in scored
+            if s.match_score.overall_score >= min_score
+            and (tier_set is None or s.opportunity.complexity_tier in tier_set)
+        ]
+
+    _remember_results(scored)
+
+    # Serialize once; repeat searches with the same inputs replay these bytes
+    payload = _scored_list_adapter.dump_json(scored)
+    fetched_at = _search_cache[cache_key][0] if cache_key in _search_cache else None
+    if fetched_at is not None and generation == _search_response_generation:
+        _search_response_cache[response_key] = (fetched_at, scored, payload)
+        _search_response_cache.move_to_end(response_key)
+        while len(_search_response_cache) > SEARCH_CACHE_MAX:
+            _search_response_cache.popitem(last=False)
+
+    return Response(content=payload, media_type="application/json")
 
-    # Complexity tier filter (empty list = show all)
-    if filters.complexity_tiers:
-        tier_set = set(filters.complexity_tiers)
-        scored = [s for s in scored if s.opportunity.complexity_tier in tier_set]
 
-    # Cache for quick access by the detail endpoint
-    global _cached_opportunities
-    _cached_opportunities = scored
+def _remember_results(scored: list[ScoredOpportunity]) -> None:
+    """Cache for quick access by the detail, proposal, stats and export endpoints."""
+    global _cached_search
+    # A response-cache hit replays the same list — reuse its views, move to newest
+    for i, entry in enumerate(_recent_searches):
+        if entry.scored is scored:
+            del _recent_searches[i]
+            break
+    else:
+        entry = _CachedSearch(scored)
+    _recent_searches.append(entry)
+    _cached_search = entry
 
-    return scored
+
+def _find_cached(notice_id: str) -> Optional[ScoredOpportunity]:
+    """Look up an opportunity in the recent result sets, newest first."""
+    for entry in reversed(_recent_searches):
+        cached = entry.by_notice_id.get(notice_id)
+        if cached is not None:
+            return cached
+    return None
 
 
 @router.get("/opportunities/{notice_id}/detail", tags=["Search"], response_model=OpportunityDetail)
@@ -339,13 +573,10 @@ async def get_opportunity_detail(
     Costs ~$0.01 per analysis (uses Claude Sonnet).
     """
     # Try cache first
-    cached = next(
-        (s.opportunity for s in _cached_opportunities if s.opportunity.notice_id == notice_id),
-        None
-    )
+    cached = _find_cached(notice_id)
 
     if cached:
-        opportunity = cached
+        opportunity = cached.opportunity
     else:
         opportunity = await sam_client.get_opportunity_detail(notice_id)
         if not opportunity:
@@ -372,37 +603,16 @@ async def get_opportunity_detail(
 @router.get("/stats", tags=["Search"])
 async def get_stats():
     """Dashboard stats."""
-    cluster_match_counts: dict[str, int] = {}
-    for s in _cached_opportunities:
-        if s.best_cluster_name:
-            cluster_match_counts[s.best_cluster_name] = (
-                cluster_match_counts.get(s.best_cluster_name, 0) + 1
-            )
-
-    tier_counts: dict[str, int] = {}
-    for s in _cached_opportunities:
-        tier = s.opportunity.complexity_tier.value
-        tier_counts[tier] = tier_counts.get(tier, 0) + 1
-
-    pursuit_status_counts: dict[str, int] = {}
-    for p in _pursuits.values():
-        pursuit_status_counts[p.status.value] = pursuit_status_counts.get(p.status.value, 0) + 1
-
-    all_sources = set(s.opportunity.source for s in _cached_opportunities)
-    by_source = {src: sum(1 for s in _cached_opportunities if s.opportunity.source == src) for src in all_sources}
+    pursuit_status_counts = Counter(p.status.value for p in _pursuits.values())
 
     return {
         "total_profiles": len(_profiles),
         "total_clusters": len(_clusters),
-        "cached_opportunities": len(_cached_opportunities),
-        "high_matches": sum(1 for s in _cached_opportunities if s.match_tier == "high"),
-        "medium_matches": sum(1 for s in _cached_opportunities if s.match_tier == "medium"),
-        "by_source": by_source,
-        "by_complexity_tier": tier_counts,
-        "by_cluster": cluster_match_counts,
+        # computed once per search, in _CachedSearch
+        **_cached_search.stats,
         "pursuits": {
             "total": len(_pursuits),
-            "by_status": pursuit_status_counts,
+            "by_status": dict(pursuit_status_counts),
         },
     }
 
@@ -423,6 +633,18 @@ class PursuitUpdate(BaseModel):
     assigned_team: Optional[list[str]] = None
 
 
+async def _db_upsert_pursuit(pursuit: Pursuit) -> None:
+    """Fire-and-forget pursuit upsert to DB."""
+    async with db_session() as session:
+        await upsert_pursuit(session, pursuit)
+
+
+async def _db_delete_pursuit(pursuit_id: str) -> None:
+    """Fire-and-forget pursuit delete from DB."""
+    async with db_session() as session:
+        await delete_pursuit_from_db(session, pursuit_id)
+
+
 @router.post("/pursuits", tags=["Pursuits"], response_model=Pursuit)
 async def create_pursuit(body: PursuitCreate):
     """
@@ -431,7 +653,7 @@ async def create_pursuit(body: PursuitCreate):
     Pursuits track an opportunity through the capture lifecycle:
     identified → qualifying → capture → proposal → submitted → won/lost.
     """
-    pursuit_id = str(uuid.uuid4())
+    pursuit_id = uuid.uuid4().hex
     cluster_name = _clusters[body.cluster_id].name if body.cluster_id and body.cluster_id in _clusters else None
     pursuit = Pursuit(
         id=pursuit_id,
@@ -445,12 +667,7 @@ async def create_pursuit(body: PursuitCreate):
     )
     _pursuits[pursuit_id] = pursuit
 
-    session = await get_db_session()
-    if session:
-        try:
-            await upsert_pursuit(session, pursuit)
-        finally:
-            await session.close()
+    _spawn(_db_upsert_pursuit(pursuit))
 
     return pursuit
 
@@ -462,10 +679,12 @@ async def list_pursuits(status: Optional[str] = Query(default=None, description=
 
     Returns pursuits sorted by updated_at descending (most recently touched first).
     """
-    pursuits = list(_pursuits.values())
+    pursuits = reversed(_pursuits.values())
     if status:
-        pursuits = [p for p in pursuits if p.status.value == status]
-    return sorted(pursuits, key=lambda p: p.updated_at, reverse=True)
+        return _json_response(
+            _pursuit_list_adapter, [p for p in pursuits if p.status.value == status]
+        )
+    return _json_response(_pursuit_list_adapter, list(pursuits))
 
 
 @router.get("/pursuits/{pursuit_id}", tags=["Pursuits"], response_model=Pursuit)
@@ -488,26 +707,21 @@ async def update_pursuit(pursuit_id: str, body: PursuitUpdate):
     if not pursuit:
         raise HTTPException(status_code=404, detail=f"Pursuit {pursuit_id} not found")
 
-    updates: dict = {}
+    # Mutate in place — body fields are already validated, no need to copy
     if body.status is not None:
-        updates["status"] = body.status
+        pursuit.status = body.status
     if body.notes is not None:
-        updates["notes"] = body.notes
+        pursuit.notes = body.notes
     if body.assigned_team is not None:
-        updates["assigned_team"] = body.assigned_team
-    updates["updated_at"] = datetime.utcnow()
+        pursuit.assigned_team = body.assigned_team
+    pursuit.updated_at = datetime.utcnow()
 
-    updated = pursuit.model_copy(update=updates)
-    _pursuits[pursuit_id] = updated
+    del _pursuits[pursuit_id]
+    _pursuits[pursuit_id] = pursuit  # move to the newest end
 
-    session = await get_db_session()
-    if session:
-        try:
-            await upsert_pursuit(session, updated)
-        finally:
-            await session.close()
+    _spawn(_db_upsert_pursuit(pursuit))
 
-    return updated
+    return pursuit
 
 
 @router.delete("/pursuits/{pursuit_id}", tags=["Pursuits"])
@@ -517,12 +731,7 @@ async def delete_pursuit(pursuit_id: str):
         raise HTTPException(status_code=404, detail=f"Pursuit {pursuit_id} not found")
     del _pursuits[pursuit_id]
 
-    session = await get_db_session()
-    if session:
-        try:
-            await delete_pursuit_from_db(session, pursuit_id)
-        finally:
-            await session.close()
+    _spawn(_db_delete_pursuit(pursuit_id))
 
     return {"deleted": pursuit_id}
 
@@ -540,16 +749,12 @@ async def run_scout(profile_id: Optional[str] = None):
 
     Returns a summary of the run including new opportunities found.
     """
-    from app.agents.scout import ScoutAgent
     from app.services.email_alerts import send_opportunity_digest
 
     clusters = list(_clusters.values())
-    profile = _profiles.get(profile_id) if profile_id else (
-        list(_profiles.values())[0] if _profiles else None
-    )
+    profile = _profiles.get(profile_id) if profile_id else next(iter(_profiles.values()), None)
 
-    agent = ScoutAgent()
-    result = await agent.run(
+    result = await scout_agent.run(
         clusters=clusters,
         agency_preferences=profile.agency_preferences if profile else [],
         geographic_preferences=profile.geographic_preferences if profile else [],
@@ -565,25 +770,31 @@ async def run_scout(profile_id: Optional[str] = None):
     result["alerts_sent"] = alerts_sent
 
     # Return a JSON-serializable summary (exclude full opportunity objects by default)
+    top_matches = [
+        {
+            "notice_id": s.opportunity.notice_id,
+            "title": s.opportunity.title,
+            "score": s.match_score.overall_score,
+            "tier": s.match_tier,
+            "cluster": s.best_cluster_name,
+            "source": s.opportunity.source,
+            "link": s.opportunity.link,
+        }
+        for s in itertools.islice(new_opps, 10)
+    ]
+    new_count = len(new_opps)
+    # Release the full scored list before the summary is serialized
+    del new_opps
+    result["new_opportunities"] = None
+
     return {
         "run_at": result["run_at"],
         "posted_from": result["posted_from"],
         "total_fetched": result["total_fetched"],
         "total_scored": result["total_scored"],
-        "new_above_threshold": len(new_opps),
+        "new_above_threshold": new_count,
         "alerts_sent": alerts_sent,
-        "top_matches": [
-            {
-                "notice_id": s.opportunity.notice_id,
-                "title": s.opportunity.title,
-                "score": s.match_score.overall_score,
-                "tier": s.match_tier,
-                "cluster": s.best_cluster_name,
-                "source": s.opportunity.source,
-                "link": s.opportunity.link,
-            }
-            for s in new_opps[:10]
-        ],
+        "top_matches": top_matches,
     }
 
 
@@ -592,10 +803,9 @@ async def scout_status():
     """
     Get Scout agent status: last run time, next run time, and cumulative stats.
     """
-    from app.agents.scout import ScoutAgent
     from app.agents.scheduler import get_scheduler, get_last_result
 
-    state = ScoutAgent.get_state()
+    state = await ScoutAgent.get_state()
     scheduler = get_scheduler()
 
     next_run = None
@@ -604,9 +814,12 @@ async def scout_status():
         if job and job.next_run_time:
             next_run = job.next_run_time.isoformat()
 
+    # runs is already a bounded ring (ScoutAgent keeps the last RUNS_CAP)
     runs = state.get("runs", [])
-    total_new = sum(r.get("new_count", 0) for r in runs)
-    total_fetched = sum(r.get("total_fetched", 0) for r in runs)
+    total_new = total_fetched = 0
+    for r in runs:
+        total_new += r.get("new_count", 0)
+        total_fetched += r.get("total_fetched", 0)
 
     last_result = get_last_result()
 
@@ -632,6 +845,9 @@ async def scout_status():
 
 # --- Backfill ---
 
+# Strong ref so the task isn't GC'd mid-run; also the handle DELETE cancels.
+_backfill_task: Optional[asyncio.Task] = None
+
 @router.post("/scout/backfill", tags=["Scout"])
 async def start_backfill(
     months: int = Query(default=12, ge=1, le=36, description="Months of history to fetch"),
@@ -661,7 +877,8 @@ async def start_backfill(
         return {"status": "already_running", "progress": get_status()}
 
     # Fire and forget — runs in the background
-    asyncio.create_task(run_backfill(months=months, resume=resume))
+    global _backfill_task
+    _backfill_task = asyncio.create_task(run_backfill(months=months, resume=resume))
     return {
         "status": "started",
         "months_requested": months,
@@ -670,6 +887,20 @@ async def start_backfill(
     }
 
 
+@router.delete("/scout/backfill", tags=["Scout"])
+async def cancel_backfill():
+    """
+    Cancel an in-progress backfill.
+
+    Months already upserted are kept and the state is marked paused — start
+    again with `resume=true` to continue from where it stopped.
+    """
+    if _backfill_task is None or _backfill_task.done():
+        raise HTTPException(status_code=404, detail="No backfill is running.")
+    _backfill_task.cancel()
+    return {"status": "cancelling"}
+
+
 @router.get("/spending/{naics_code}", tags=["Intel"])
 async def get_spending_trends(naics_code: str):
     """
@@ -679,9 +910,7 @@ async def get_spending_trends(naics_code: str):
     Useful for market-sizing: how big is the federal market in your NAICS?
     Data sourced from USASpending.gov. Results cached 24 hours.
     """
-    from app.services.usaspending_client import USASpendingClient
-    client = USASpendingClient()
-    return await client.get_spending(naics_code)
+    return await usaspending_client.get_spending(naics_code)
 
 
 @router.get("/intel/{naics_code}", tags=["Intel"])
@@ -699,9 +928,7 @@ async def get_competitive_intel(
     Data sourced from USASpending.gov (which aggregates FPDS award records).
     Results cached 24 hours. Returns up to 50 award records sorted by amount descending.
     """
-    from app.services.fpds_client import FPDSClient
-    client = FPDSClient()
-    return await client.get_intel(naics_code=naics_code, agency=agency, years=years)
+    return await fpds_client.get_intel(naics_code=naics_code, agency=agency, years=years)
 
 
 @router.post("/opportunities/{notice_id}/proposal", tags=["Search"])
@@ -718,11 +945,8 @@ async def generate_proposal(
     call again to regenerate.
     """
     # Find opportunity in cache
-    opp = None
-    for scored in _cached_opportunities:
-        if scored.opportunity.notice_id == notice_id:
-            opp = scored.opportunity
-            break
+    cached = _find_cached(notice_id)
+    opp = cached.opportunity if cached else None
 
     if opp is None:
         raise HTTPException(status_code=404, detail=f"Opportunity {notice_id} not found in current results. Run a search first.")
@@ -731,13 +955,84 @@ async def generate_proposal(
     if cluster is None:
         raise HTTPException(status_code=404, detail=f"Cluster {cluster_id} not found.")
 
-    from app.services.proposal_generator import ProposalGenerator
-    gen = ProposalGenerator()
-    return await gen.generate(opp, cluster)
+    return await proposal_generator.generate(opp, cluster)
 
 
 # --- Export ---
 
+_OPPORTUNITY_EXPORT_HEADERS = [
+    "notice_id", "title", "department", "naics_code", "set_aside",
+    "complexity_tier", "estimated_competition", "posted_date",
+    "response_deadline", "estimated_value", "source", "match_score",
+    "match_tier", "best_cluster", "link",
+]
+
+
+_PURSUIT_EXPORT_HEADERS = [
+    "id", "opportunity_id", "opportunity_title", "cluster_name", "status",
+    "notes", "assigned_team", "created_at", "updated_at",
+]
+
+
+def _build_xlsx(sheet_title: str, headers: list[str], rows) -> bytes:
+    """Serialize rows to an .xlsx file. CPU-bound — call via asyncio.to_thread."""
+    import io
+    import openpyxl
+    # write_only streams rows to the sheet XML instead of building a cell grid
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_title)
+    ws.append(headers)
+    for row in rows:
+        ws.append(row)
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+class _EchoBuffer:
+    """File-like sink whose write() returns the text, so csv writers yield lines."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _opportunity_export_row(s: ScoredOpportunity) -> list:
+    """One export row, in _OPPORTUNITY_EXPORT_HEADERS order."""
+    opp = s.opportunity
+    return [
+        opp.notice_id,
+        opp.title,
+        opp.department,
+        opp.naics_code,
+        opp.set_aside,
+        opp.complexity_tier.value,
+        opp.estimated_competition.value,
+        opp.posted_date,
+        opp.response_deadline,
+        opp.estimated_value,
+        opp.source,
+        s.match_score.overall_score,
+        s.match_tier,
+        s.best_cluster_name,
+        opp.link,
+    ]
+
+
+def _pursuit_export_row(p: Pursuit) -> list:
+    """One export row, in _PURSUIT_EXPORT_HEADERS order."""
+    return [
+        p.id,
+        p.opportunity_id,
+        p.opportunity_title,
+        p.cluster_name,
+        p.status.value,
+        p.notes,
+        ", ".join(p.assigned_team),
+        p.created_at.isoformat(),
+        p.updated_at.isoformat(),
+    ]
+
+
 @router.get("/export/opportunities", tags=["Export"])
 async def export_opportunities(
     format: str = Query(default="csv", description="Export format: csv or xlsx"),
@@ -752,55 +1047,28 @@ async def export_opportunities(
     import io
     from fastapi.responses import StreamingResponse
 
-    rows = [
-        {
-            "notice_id": s.opportunity.notice_id,
-            "title": s.opportunity.title,
-            "department": s.opportunity.department,
-            "naics_code": s.opportunity.naics_code,
-            "set_aside": s.opportunity.set_aside,
-            "complexity_tier": s.opportunity.complexity_tier.value,
-            "estimated_competition": s.opportunity.estimated_competition.value,
-            "posted_date": s.opportunity.posted_date,
-            "response_deadline": s.opportunity.response_deadline,
-            "estimated_value": s.opportunity.estimated_value,
-            "source": s.opportunity.source,
-            "match_score": s.match_score.overall_score,
-            "match_tier": s.match_tier,
-            "best_cluster": s.best_cluster_name,
-            "link": s.opportunity.link,
-        }
-        for s in _cached_opportunities
-    ]
-
-    if not rows:
+    opps = _cached_search.scored  # snapshot — a new search rebinds, never mutates
+    if not opps:
         raise HTTPException(status_code=404, detail="No opportunities in cache. Run a search first.")
 
     if format == "xlsx":
-        import openpyxl
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Opportunities"
-        headers = list(rows[0].keys())
-        ws.append(headers)
-        for row in rows:
-            ws.append([row.get(h) for h in headers])
-        buf = io.BytesIO()
-        wb.save(buf)
-        buf.seek(0)
+        data = await asyncio.to_thread(
+            _build_xlsx, "Opportunities", _OPPORTUNITY_EXPORT_HEADERS,
+            map(_opportunity_export_row, opps),
+        )
         return StreamingResponse(
-            buf,
+            io.BytesIO(data),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": "attachment; filename=opportunities.xlsx"},
         )
     else:
-        buf = io.StringIO()
-        writer = csv.DictWriter(buf, fieldnames=list(rows[0].keys()))
-        writer.writeheader()
-        writer.writerows(rows)
-        buf.seek(0)
+        async def lines():
+            writer = csv.writer(_EchoBuffer())
+            for row in itertools.chain([_OPPORTUNITY_EXPORT_HEADERS], map(_opportunity_export_row, opps)):
+                yield writer.writerow(row)
+
         return StreamingResponse(
-            iter([buf.getvalue()]),
+            lines(),
             media_type="text/csv",
             headers={"Content-Disposition": "attachment; filename=opportunities.csv"},
         )
@@ -817,49 +1085,30 @@ async def export_pursuits(
     import io
     from fastapi.responses import StreamingResponse
 
-    rows = [
-        {
-            "id": p.id,
-            "opportunity_id": p.opportunity_id,
-            "opportunity_title": p.opportunity_title,
-            "cluster_name": p.cluster_name,
-            "status": p.status.value,
-            "notes": p.notes,
-            "assigned_team": ", ".join(p.assigned_team),
-            "created_at": p.created_at.isoformat(),
-            "updated_at": p.updated_at.isoformat(),
-        }
-        for p in sorted(_pursuits.values(), key=lambda p: p.updated_at, reverse=True)
-    ]
-
-    if not rows:
+    # newest first; a snapshot of references so the export is stable while
+    # the live dict keeps changing (and is safe to walk from a worker thread)
+    pursuits = tuple(reversed(_pursuits.values()))
+    if not pursuits:
         raise HTTPException(status_code=404, detail="No pursuits to export.")
 
     if format == "xlsx":
-        import openpyxl
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Pursuits"
-        headers = list(rows[0].keys())
-        ws.append(headers)
-        for row in rows:
-            ws.append([row.get(h) for h in headers])
-        buf = io.BytesIO()
-        wb.save(buf)
-        buf.seek(0)
+        data = await asyncio.to_thread(
+            _build_xlsx, "Pursuits", _PURSUIT_EXPORT_HEADERS,
+            map(_pursuit_export_row, pursuits),
+        )
         return StreamingResponse(
-            buf,
+            io.BytesIO(data),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": "attachment; filename=pursuits.xlsx"},
         )
     else:
-        buf = io.StringIO()
-        writer = csv.DictWriter(buf, fieldnames=list(rows[0].keys()))
-        writer.writeheader()
-        writer.writerows(rows)
-        buf.seek(0)
+        async def lines():
+            writer = csv.writer(_EchoBuffer())
+            for row in itertools.chain([_PURSUIT_EXPORT_HEADERS], map(_pursuit_export_row, pursuits)):
+                yield writer.writerow(row)
+
         return StreamingResponse(
-            iter([buf.getvalue()]),
+            lines(),
             media_type="text/csv",
             headers={"Content-Disposition": "attachment; filename=pursuits.csv"},
         )
@@ -5,7 +5,8 @@ All public functions degrade gracefully if DATABASE_URL is not set — the app r
 in in-memory mode (V1) without any code changes elsewhere.
 """
 import logging
-from typing import AsyncGenerator, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
@@ -13,6 +14,7 @@ from sqlalchemy.orm import DeclarativeBase
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
+_settings = get_settings()  # lru_cached singleton — bind once instead of per call
 
 _engine = None
 _session_factory: Optional[async_sessionmaker] = None
@@ -24,24 +26,31 @@ class Base(DeclarativeBase):
 
 def db_enabled() -> bool:
     """Return True if DATABASE_URL is configured."""
-    return bool(get_settings().database_url)
+    return bool(_settings.database_url)
 
 
 def _make_engine():
-    settings = get_settings()
-    url = settings.database_url
+    url = _settings.database_url
     # Normalise driver prefix — Supabase connection strings often start with postgres://
     if url.startswith("postgres://"):
         url = "postgresql+asyncpg://" + url[len("postgres://"):]
     elif url.startswith("postgresql://"):
         url = "postgresql+asyncpg://" + url[len("postgresql://"):]
     # If already postgresql+asyncpg:// leave it alone
+    connect_args = {}
+    if "pooler.supabase.com:6543" in url:
+        # Supavisor transaction mode hands each transaction a different backend,
+        # so prepared statements can't be reused — disable asyncpg's caches.
+        # Session mode (:5432) and direct connections keep the defaults, where
+        # prepared-statement caching saves a parse on every repeated query.
+        connect_args = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
     return create_async_engine(
         url,
-        echo=settings.debug,
-        pool_size=5,
-        max_overflow=10,
+        echo=_settings.debug,
+        pool_size=10,
+        max_overflow=20,
         pool_pre_ping=True,
+        connect_args=connect_args,
     )
 
 
@@ -85,6 +94,21 @@ async def get_db_session() -> Optional[AsyncSession]:
     return _session_factory()
 
 
+@asynccontextmanager
+async def db_session() -> AsyncIterator[Optional[AsyncSession]]:
+    """
+    Check out a pooled AsyncSession for the duration of an `async with` block.
+
+    Yields None if DB is not available — db_ops helpers no-op on None, so
+    callers don't need their own guard. The session is closed on exit.
+    """
+    if _session_factory is None:
+        yield None
+        return
+    async with _session_factory() as session:
+        yield session
+
+
 async def close_db() -> None:
     """Dispose the engine on shutdown."""
     global _engine
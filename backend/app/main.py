@@ -1,14 +1,18 @@
 """GovContract AI - FastAPI Application."""
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.routes import router, _clusters, _profiles, _pursuits
+from app.api.routes import router, _clusters, _profiles, _pursuits, stop_upsert_worker
 from app.core.config import get_settings
-from app.core.database import init_db, close_db, get_db_session
+from app.core.database import init_db, close_db, db_session
 from app.agents.scheduler import start_scheduler, stop_scheduler
+from app.agents.scout import shutdown_scorer_pool
+from app.services.analyzer import close_anthropic
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -21,8 +25,29 @@ def _get_all_clusters():
 
 
 def _get_first_profile():
-    profiles = list(_profiles.values())
-    return profiles[0] if profiles else None
+    return next(iter(_profiles.values()), None)
+
+
+async def _load_clusters() -> None:
+    from app.services.db_ops import get_all_clusters_from_db
+    async with db_session() as session:
+        db_clusters = await get_all_clusters_from_db(session)
+    for c in db_clusters:
+        _clusters[c.id] = c
+    if db_clusters:
+        logger.info(f"Loaded {len(db_clusters)} clusters from DB")
+
+
+async def _load_pursuits() -> None:
+    from app.services.db_ops import get_all_pursuits_from_db
+    async with db_session() as session:
+        db_pursuits = await get_all_pursuits_from_db(session)
+    # _pursuits is kept in updated_at order (oldest first) — see routes.py.
+    # db_ops returns newest first, so walk it backwards rather than re-sorting.
+    for p in reversed(db_pursuits):
+        _pursuits[p.id] = p
+    if db_pursuits:
+        logger.info(f"Loaded {len(db_pursuits)} pursuits from DB")
 
 
 @asynccontextmanager
@@ -30,27 +55,16 @@ async def lifespan(app: FastAPI):
     # Startup — initialise DB first, then load persisted data
     db_ready = await init_db()
     if db_ready:
-        from app.services.db_ops import get_all_clusters_from_db, get_all_pursuits_from_db
-        session = await get_db_session()
-        if session:
-            try:
-                db_clusters = await get_all_clusters_from_db(session)
-                for c in db_clusters:
-                    _clusters[c.id] = c
-                if db_clusters:
-                    logger.info(f"Loaded {len(db_clusters)} clusters from DB")
-                db_pursuits = await get_all_pursuits_from_db(session)
-                for p in db_pursuits:
-                    _pursuits[p.id] = p
-                if db_pursuits:
-                    logger.info(f"Loaded {len(db_pursuits)} pursuits from DB")
-            finally:
-                await session.close()
+        # Independent SELECTs — run them concurrently on separate sessions
+        await asyncio.gather(_load_clusters(), _load_pursuits())
 
     start_scheduler(_get_all_clusters, _get_first_profile)
     yield
     # Shutdown
     stop_scheduler()
+    await asyncio.to_thread(shutdown_scorer_pool)
+    await close_anthropic()
+    await stop_upsert_worker()
     await close_db()
 
 
@@ -72,6 +86,7 @@ app = FastAPI(
     ),
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     openapi_tags=[
         {"name": "Profiles", "description": "Company profile management"},
         {"name": "Clusters", "description": "Capability cluster CRUD — NAICS codes, certifications, team roster"},
@@ -107,9 +122,10 @@ async def root():
 
 @app.get("/health")
 async def health():
-    from app.core.database import db_enabled, _session_factory
+    from app.core.database import _session_factory
     return {
         "status": "healthy",
         "sam_api_configured": bool(settings.sam_gov_api_key),
-        "db_connected": db_enabled() and _session_factory is not None,
+        # init_db only builds a session factory when DATABASE_URL is set
+        "db_connected": _session_factory is not None,
     }
@@ -6,7 +6,7 @@ remain the canonical runtime models — these classes are for DB I/O only.
 from datetime import datetime
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Float, Integer, String, Text,
+    Boolean, Column, DateTime, Float, Index, Integer, String, Text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -22,7 +22,7 @@ class OpportunityRow(Base):
     department = Column(String)
     sub_tier = Column(String)
     office = Column(String)
-    naics_code = Column(String)
+    naics_code = Column(String, index=True)
     naics_description = Column(String)
     set_aside = Column(String)
     opportunity_type = Column(String)
@@ -41,6 +41,11 @@ class OpportunityRow(Base):
     first_seen_at = Column(DateTime, default=datetime.utcnow)
     last_updated_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # active opportunities by posted date — browsing the backfilled history
+        Index("ix_opportunities_active_posted", "active", "posted_date"),
+    )
+
 
 class ClusterRow(Base):
     __tablename__ = "clusters"
@@ -84,6 +89,11 @@ class HistoricalAwardRow(Base):
     period_end = Column(String)
     fetched_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # get_historical_awards: naics_code = ? AND fetched_at >= cutoff
+        Index("ix_historical_awards_naics_fetched", "naics_code", "fetched_at"),
+    )
+
 
 class SpendingTrendRow(Base):
     """Aggregate federal spending by NAICS code and fiscal year (USASpending.gov)."""
@@ -97,6 +107,11 @@ class SpendingTrendRow(Base):
     top_agency = Column(String)
     fetched_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # get_spending_trends: naics_code = ? ORDER BY fiscal_year DESC
+        Index("ix_spending_trends_naics_year", "naics_code", "fiscal_year"),
+    )
+
 
 class SemanticScoreRow(Base):
     __tablename__ = "semantic_scores"
@@ -118,4 +133,4 @@ class PursuitRow(Base):
     notes = Column(Text)
     assigned_team = Column(JSONB, default=list)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, index=True)  # startup load orders by it
@@ -1,5 +1,6 @@
 """Data models for GovContract AI."""
-from pydantic import BaseModel, Field
+import sys
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 from datetime import datetime
 from enum import Enum
@@ -125,6 +126,16 @@ class Opportunity(BaseModel):
     complexity_tier: ComplexityTier = ComplexityTier.STANDARD
     estimated_competition: CompetitionLevel = CompetitionLevel.OPEN
 
+    @field_validator(
+        "department", "sub_tier", "office", "naics_code",
+        "set_aside", "opportunity_type", "source",
+    )
+    @classmethod
+    def _intern(cls, v: Optional[str]) -> Optional[str]:
+        # Low-cardinality fields repeat across thousands of cached and
+        # backfilled opportunities — share one string object per value
+        return sys.intern(v) if v is not None else None
+
 
 class MatchScore(BaseModel):
     """Breakdown of how well an opportunity matches a company profile."""
@@ -150,21 +161,29 @@ class ScoredOpportunity(BaseModel):
 class SearchFilters(BaseModel):
     """Filters for searching opportunities."""
     keywords: Optional[str] = None
-    naics_codes: list[str] = Field(default_factory=list)
+    naics_codes: tuple[str, ...] = ()
     set_aside: Optional[str] = None
     posted_from: Optional[str] = None
     posted_to: Optional[str] = None
     response_deadline_from: Optional[str] = None
-    opportunity_types: list[str] = Field(default_factory=list)
+    opportunity_types: tuple[str, ...] = ()
     department: Optional[str] = None
     min_score: float = 0
     limit: int = 50
     offset: int = 0
-    complexity_tiers: list[ComplexityTier] = Field(
-        default_factory=list,
+    # frozenset: parsed once into the form the post-scoring filter and the
+    # response cache key both use directly (JSON arrays in, arrays out)
+    complexity_tiers: frozenset[ComplexityTier] = Field(
+        default_factory=frozenset,
         description="Filter by complexity tier (MICRO/SIMPLIFIED/STANDARD/MAJOR). Empty = show all.",
     )
 
+    @field_validator("naics_codes", "opportunity_types")
+    @classmethod
+    def _canonical_order(cls, v: tuple[str, ...]) -> tuple[str, ...]:
+        # Sorted once at parse time so cache keys can use the fields as-is
+        return tuple(sorted(v))
+
 
 class PursuitStatus(str, Enum):
     """Kanban stages for a contract pursuit."""
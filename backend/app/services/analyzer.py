@@ -1,9 +1,13 @@
 """Claude-powered opportunity analysis and semantic scoring."""
+import asyncio
+import functools
 import logging
-import json
+import re
 from typing import Optional
 
 import anthropic
+import httpx
+import orjson
 
 from app.core.config import get_settings
 from app.models.schemas import (
@@ -12,6 +16,46 @@ from app.models.schemas import (
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_CALLS = 8  # Claude requests in flight at once (rate-limit headroom)
+
+_JSON_OBJECT = re.compile(r"\{.*\}", re.S)
+
+
+@functools.lru_cache(maxsize=1)
+def get_anthropic() -> anthropic.AsyncAnthropic:
+    """
+    One process-wide async client on a keep-alive pool: calls don't block the
+    event loop, and the analyzer and SemanticScorer reuse the same warm TLS
+    connections.
+    """
+    return anthropic.AsyncAnthropic(
+        api_key=get_settings().anthropic_api_key,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        ),
+    )
+
+
+async def close_anthropic() -> None:
+    """Close the shared client's connection pool on shutdown (no-op if never built)."""
+    if get_anthropic.cache_info().currsize:
+        await get_anthropic().close()
+        get_anthropic.cache_clear()
+
+
+def _parse_json_object(text: str) -> dict:
+    """Parse the JSON object in a Claude reply, tolerating ```json fences or stray prose."""
+    match = _JSON_OBJECT.search(text)
+    if match is None:
+        raise ValueError(f"No JSON object in reply: {text[:80]!r}")
+    return orjson.loads(match.group())
+
 
 class OpportunityAnalyzer:
     """Uses Claude to analyze opportunities and generate semantic match scores."""
@@ -20,8 +64,9 @@ class OpportunityAnalyzer:
         self.settings = get_settings()
         self.client = None
         if self.settings.anthropic_api_key:
-            self.client = anthropic.Anthropic(api_key=self.settings.anthropic_api_key)
-    
+            self.client = get_anthropic()
+        self._limit = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+
     async def enrich_with_semantic_score(
         self,
         scored_opp: ScoredOpportunity,
@@ -55,18 +100,14 @@ Score guide:
 - 5-14: Weak alignment, tangential fit
 - 0-4: No meaningful connection"""
 
-            response = self.client.messages.create(
-                model="claude-haiku-4-5-20251001",
-                max_tokens=200,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            async with self._limit:
+                response = await self.client.messages.create(
+                    model="claude-haiku-4-5-20251001",
+                    max_tokens=200,
+                    messages=[{"role": "user", "content": prompt}],
+                )
             
-            result_text = response.content[0].text.strip()
-            # Handle potential markdown wrapping
-            if result_text.startswith("```"):
-                result_text = result_text.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
-            
-            result = json.loads(result_text)
+            result = _parse_json_object(response.content[0].text)
             semantic_score = min(max(float(result.get("score", 0)), 0), 30)
             reason = result.get("reason", "")
             
@@ -134,17 +175,14 @@ Respond with ONLY a JSON object:
     "deadline_urgency": "<urgent|soon|normal|past>"
 }}"""
 
-            response = self.client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=self.settings.claude_max_tokens_per_analysis,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            
-            result_text = response.content[0].text.strip()
-            if result_text.startswith("```"):
-                result_text = result_text.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
+            async with self._limit:
+                response = await self.client.messages.create(
+                    model="claude-sonnet-4-5-20250929",
+                    max_tokens=self.settings.claude_max_tokens_per_analysis,
+                    messages=[{"role": "user", "content": prompt}],
+                )
             
-            result = json.loads(result_text)
+            result = _parse_json_object(response.content[0].text)
             
             return OpportunityDetail(
                 opportunity=opportunity,
@@ -5,6 +5,7 @@ configured or unavailable), they silently no-op so the rest of the app
 continues in in-memory mode without any special-casing at the call site.
 """
 import logging
+import operator
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -17,6 +18,19 @@ from app.models.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Opportunity attributes copied verbatim into OpportunityRow columns of the
+# same name; attrgetter fetches them all in one C-level call per opportunity
+_OPP_FIELDS = (
+    "notice_id", "title", "solicitation_number", "department", "sub_tier",
+    "office", "naics_code", "naics_description", "set_aside", "opportunity_type",
+    "posted_date", "response_deadline", "description", "place_of_performance",
+    "point_of_contact", "estimated_value", "award_amount", "link", "active", "source",
+)
+_OPP_GET = operator.attrgetter(*_OPP_FIELDS)
+_OPP_COLUMNS = _OPP_FIELDS + (
+    "complexity_tier", "estimated_competition", "first_seen_at", "last_updated_at",
+)
+
 
 # ---------------------------------------------------------------------------
 # Opportunities
@@ -39,37 +53,24 @@ async def upsert_opportunities(
         from app.models.db_models import OpportunityRow
 
         now = datetime.utcnow()
+        # first_seen_at is set here but excluded from on_conflict set_, so the
+        # original insert value is preserved
         rows = [
-            {
-                "notice_id": opp.notice_id,
-                "title": opp.title,
-                "solicitation_number": opp.solicitation_number,
-                "department": opp.department,
-                "sub_tier": opp.sub_tier,
-                "office": opp.office,
-                "naics_code": opp.naics_code,
-                "naics_description": opp.naics_description,
-                "set_aside": opp.set_aside,
-                "opportunity_type": opp.opportunity_type,
-                "posted_date": opp.posted_date,
-                "response_deadline": opp.response_deadline,
-                "description": opp.description,
-                "place_of_performance": opp.place_of_performance,
-                "point_of_contact": opp.point_of_contact,
-                "estimated_value": opp.estimated_value,
-                "award_amount": opp.award_amount,
-                "link": opp.link,
-                "active": opp.active,
-                "source": opp.source,
-                "complexity_tier": opp.complexity_tier.value,
-                "estimated_competition": opp.estimated_competition.value,
-                "first_seen_at": now,   # preserved — excluded from on_conflict set_
-                "last_updated_at": now,
-            }
-            for opp in opportunities
+            dict(zip(_OPP_COLUMNS, _OPP_GET(opp) + (
+                opp.complexity_tier.value, opp.estimated_competition.value, now, now,
+            )))
+            # Last copy wins — ON CONFLICT can't touch the same row twice per statement
+            for opp in {o.notice_id: o for o in opportunities}.values()
         ]
 
-        stmt = insert(OpportunityRow).values(rows)
+        # The statement carries no literal VALUES, so its structure is the same
+        # on every call: SQLAlchemy compiles it once and every later flush (each
+        # search batch, each backfill batch) reuses the cached SQL instead of
+        # compiling a fresh INSERT sized to that batch. Rows go in as an
+        # executemany parameter list; each row binds only its own columns, so no
+        # bind-parameter limit applies, and SQLAlchemy pages the rows into
+        # multi-row INSERTs itself. One execute, one transaction.
+        stmt = insert(OpportunityRow)
         stmt = stmt.on_conflict_do_update(
             index_elements=["notice_id"],
             set_={
@@ -91,7 +92,7 @@ async def upsert_opportunities(
                 # first_seen_at intentionally omitted — keep original insert value
             },
         )
-        await session.execute(stmt)
+        await session.execute(stmt, rows)
         await session.commit()
         logger.debug(f"DB: upserted {len(rows)} opportunities")
     except Exception as e:
@@ -102,6 +103,61 @@ async def upsert_opportunities(
             pass
 
 
+_POC_INDEX = _OPP_FIELDS.index("point_of_contact")
+
+
+async def bulk_insert_opportunities_fast(
+    session: Optional[AsyncSession],
+    opportunities: list[Opportunity],
+) -> bool:
+    """
+    Insert opportunities with PostgreSQL COPY — the fast path for first-time loads.
+
+    COPY skips per-row statement execution but can't resolve conflicts, so if
+    any notice_id already exists (or COPY fails for any other reason) the
+    transaction is rolled back and the batch goes through upsert_opportunities
+    instead. Returns False in that case so callers can stop trying COPY.
+    """
+    if session is None or not opportunities:
+        return True
+    import orjson
+    from asyncpg.exceptions import UniqueViolationError
+
+    try:
+        now = datetime.utcnow()
+        records = []
+        for opp in {o.notice_id: o for o in opportunities}.values():
+            vals = _OPP_GET(opp)
+            poc = vals[_POC_INDEX]
+            # SQLAlchemy's asyncpg dialect registers a text codec for jsonb
+            records.append(
+                vals[:_POC_INDEX]
+                + (orjson.dumps(poc).decode() if poc is not None else None,)
+                + vals[_POC_INDEX + 1:]
+                + (opp.complexity_tier.value, opp.estimated_competition.value, now, now)
+            )
+
+        conn = await session.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            "opportunities", records=records, columns=list(_OPP_COLUMNS),
+        )
+        await session.commit()
+        logger.debug(f"DB: copied {len(records)} opportunities")
+        return True
+    except Exception as e:
+        if isinstance(e, UniqueViolationError):
+            logger.debug("DB: COPY hit existing notice_ids, falling back to upsert")
+        else:
+            logger.warning(f"DB bulk_insert_opportunities_fast failed, falling back to upsert: {e}")
+        try:
+            await session.rollback()
+        except Exception:
+            pass
+        await upsert_opportunities(session, opportunities)
+        return False
+
+
 # ---------------------------------------------------------------------------
 # Clusters
 # ---------------------------------------------------------------------------
@@ -170,6 +226,41 @@ async def delete_cluster_from_db(
             pass
 
 
+def _cluster_from_row(row, trusted: bool) -> CapabilityCluster:
+    """
+    Build a CapabilityCluster from a ClusterRow.
+
+    Rows were validated on the way in (upsert_cluster), so the trusted path
+    skips Pydantic validation via model_construct; enum values and roster
+    keys are still checked so a malformed row raises instead of loading.
+    A NULL created_at (the column is nullable) always takes the validated
+    path, which rejects the row rather than loading a None timestamp.
+    """
+    certifications = [CertificationType(c) for c in (row.certifications or [])]
+    if not trusted or row.created_at is None:
+        return CapabilityCluster(
+            id=row.id,
+            name=row.name,
+            naics_codes=row.naics_codes or [],
+            certifications=certifications,
+            capability_description=row.capability_description or "",
+            team_roster=[TeamMember(**m) for m in (row.team_roster or [])],
+            created_at=row.created_at,
+        )
+    return CapabilityCluster.model_construct(
+        id=row.id,
+        name=row.name,
+        naics_codes=row.naics_codes or [],
+        certifications=certifications,
+        capability_description=row.capability_description or "",
+        team_roster=[
+            TeamMember.model_construct(name=m["name"], role=m["role"], clearance=m.get("clearance"))
+            for m in (row.team_roster or [])
+        ],
+        created_at=row.created_at,
+    )
+
+
 async def get_all_clusters_from_db(
     session: Optional[AsyncSession],
 ) -> list[CapabilityCluster]:
@@ -183,22 +274,13 @@ async def get_all_clusters_from_db(
         clusters = []
         for row in rows:
             try:
-                cluster = CapabilityCluster(
-                    id=row.id,
-                    name=row.name,
-                    naics_codes=row.naics_codes or [],
-                    certifications=[
-                        CertificationType(c) for c in (row.certifications or [])
-                    ],
-                    capability_description=row.capability_description or "",
-                    team_roster=[
-                        TeamMember(**m) for m in (row.team_roster or [])
-                    ],
-                    created_at=row.created_at,
-                )
-                clusters.append(cluster)
-            except Exception as e:
-                logger.warning(f"DB: failed to deserialise cluster {row.id}: {e}")
+                clusters.append(_cluster_from_row(row, trusted=True))
+            except Exception:
+                # Corrupt row — retry with full validation so the error is specific
+                try:
+                    clusters.append(_cluster_from_row(row, trusted=False))
+                except Exception as e:
+                    logger.warning(f"DB: failed to deserialise cluster {row.id}: {e}")
         return clusters
     except Exception as e:
         logger.error(f"DB get_all_clusters failed: {e}")
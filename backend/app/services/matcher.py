@@ -56,12 +56,21 @@ class MatchingEngine:
         opportunities: list[Opportunity],
         profile: CompanyProfile,
     ) -> list[ScoredOpportunity]:
-        """Score and rank a list of opportunities against a company profile."""
+        """
+        Score and rank a list of opportunities against a company profile.
+
+        Results are assembled with model_construct: every part is either an
+        already-validated input model or a MatchScore built by _compute_match.
+        """
+        # Normalise the profile's text preferences once for the whole batch
+        agency_terms = self._agency_terms(profile.agency_preferences)
+        geo_terms = self._geo_terms(profile.geographic_preferences)
+
         scored = []
         for opp in opportunities:
-            match_score = self._compute_match(opp, profile)
+            match_score = self._compute_match(opp, profile, agency_terms, geo_terms)
             tier = self._get_tier(match_score.overall_score)
-            scored.append(ScoredOpportunity(
+            scored.append(ScoredOpportunity.model_construct(
                 opportunity=opp,
                 match_score=match_score,
                 match_tier=tier,
@@ -71,12 +80,18 @@ class MatchingEngine:
         scored.sort(key=lambda x: x.match_score.overall_score, reverse=True)
         return scored
 
-    def _compute_match(self, opp: Opportunity, profile: CompanyProfile) -> MatchScore:
+    def _compute_match(
+        self,
+        opp: Opportunity,
+        profile: CompanyProfile,
+        agency_terms: list[tuple[str, list[str]]],
+        geo_terms: list[str],
+    ) -> MatchScore:
         """Compute the full match score breakdown."""
         naics = self._score_naics(opp, profile)
         set_aside = self._score_set_aside(opp, profile)
-        agency = self._score_agency(opp, profile)
-        geo = self._score_geography(opp, profile)
+        agency = self._match_agency(opp, agency_terms)
+        geo = self._match_geography(opp, geo_terms)
 
         # Semantic score placeholder — filled by analyzer.py when Claude is called
         semantic = 0.0
@@ -129,14 +144,6 @@ class MatchingEngine:
 
         return 0.0
 
-    def _score_agency(self, opp: Opportunity, profile: CompanyProfile) -> float:
-        """Score agency preference (0-10 points)."""
-        return self._match_agency(opp, profile.agency_preferences)
-
-    def _score_geography(self, opp: Opportunity, profile: CompanyProfile) -> float:
-        """Score geographic fit (0-10 points)."""
-        return self._match_geography(opp, profile.geographic_preferences)
-
     # ------------------------------------------------------------------
     # Cluster-based matching (new in feat/clusters-and-tiers)
     # ------------------------------------------------------------------
@@ -162,36 +169,50 @@ class MatchingEngine:
                 (typically from the parent CompanyProfile).
             geographic_preferences: Geographic preferences shared across all clusters.
         """
-        agency_prefs = agency_preferences or []
-        geo_prefs = geographic_preferences or []
+        agency_terms = self._agency_terms(agency_preferences or [])
+        geo_terms = self._geo_terms(geographic_preferences or [])
 
         if not clusters:
+            # One shared zero score; nothing downstream enriches unscored results
+            unscored = MatchScore(
+                overall_score=0, naics_score=0, set_aside_score=0,
+                agency_score=0, geo_score=0, semantic_score=0,
+                explanation="No capability clusters configured for matching",
+            )
             return [
-                ScoredOpportunity(
-                    opportunity=opp,
-                    match_score=MatchScore(
-                        overall_score=0, naics_score=0, set_aside_score=0,
-                        agency_score=0, geo_score=0, semantic_score=0,
-                        explanation="No capability clusters configured for matching",
-                    ),
-                    match_tier="unscored",
+                ScoredOpportunity.model_construct(
+                    opportunity=opp, match_score=unscored, match_tier="unscored",
                 )
                 for opp in opportunities
             ]
 
+        # Per-batch precompute: each cluster's NAICS lookup sets are built once.
+        # Agency and geography don't depend on the cluster, so they are scored
+        # once per opportunity, and only the winning cluster gets a MatchScore.
+        naics_indexes = [self._naics_index(c.naics_codes) for c in clusters]
+
         scored = []
         for opp in opportunities:
-            best_score: MatchScore | None = None
             best_cluster: CapabilityCluster | None = None
-
-            for cluster in clusters:
-                score = self._compute_cluster_match(opp, cluster, agency_prefs, geo_prefs)
-                if best_score is None or score.overall_score > best_score.overall_score:
-                    best_score = score
+            best_total = -1.0
+            best_naics = best_set_aside = 0.0
+
+            for cluster, naics_index in zip(clusters, naics_indexes):
+                naics = self._match_naics_indexed(opp.naics_code, naics_index)
+                set_aside = self._score_cluster_certifications(opp, cluster)
+                if naics + set_aside > best_total:
+                    best_total = naics + set_aside
+                    best_naics, best_set_aside = naics, set_aside
                     best_cluster = cluster
 
+            best_score = self._cluster_match_score(
+                best_naics,
+                best_set_aside,
+                self._match_agency(opp, agency_terms),
+                self._match_geography(opp, geo_terms),
+            )
             tier = self._get_tier(best_score.overall_score)
-            scored.append(ScoredOpportunity(
+            scored.append(ScoredOpportunity.model_construct(
                 opportunity=opp,
                 match_score=best_score,
                 match_tier=tier,
@@ -202,25 +223,20 @@ class MatchingEngine:
         scored.sort(key=lambda x: x.match_score.overall_score, reverse=True)
         return scored
 
-    def _compute_cluster_match(
+    def _cluster_match_score(
         self,
-        opp: Opportunity,
-        cluster: CapabilityCluster,
-        agency_preferences: list[str],
-        geographic_preferences: list[str],
+        naics: float,
+        set_aside: float,
+        agency: float,
+        geo: float,
     ) -> MatchScore:
         """
-        Compute match score for one opportunity against one capability cluster.
+        Assemble the match score for an opportunity's best capability cluster.
 
-        NAICS and certification scoring use cluster-specific data.
-        Agency and geography scoring use profile-level shared preferences.
+        NAICS and certification scores come from the cluster.
+        Agency and geography scores use profile-level shared preferences.
         Semantic scoring is zero here — the analyzer enriches it separately.
         """
-        naics = self._match_naics_codes(opp.naics_code, cluster.naics_codes)
-        set_aside = self._score_cluster_certifications(opp, cluster)
-        agency = self._match_agency(opp, agency_preferences)
-        geo = self._match_geography(opp, geographic_preferences)
-
         overall = naics + set_aside + agency + geo
 
         explanations = []
@@ -304,33 +320,76 @@ class MatchingEngine:
 
         return 0.0
 
-    def _match_agency(self, opp: Opportunity, agency_preferences: list[str]) -> float:
-        """Score agency preference (0-10 points). Shared by profile and cluster paths."""
-        if not agency_preferences or not opp.department:
+    def _naics_index(
+        self,
+        codes: list[str],
+    ) -> tuple[frozenset[str], frozenset[str], frozenset[str]]:
+        """Exact codes plus 4- and 2-digit prefixes, for O(1) _match_naics_indexed lookups."""
+        return (
+            frozenset(codes),
+            frozenset(c[:4] for c in codes if len(c) >= 4),
+            frozenset(c[:2] for c in codes if len(c) >= 2),
+        )
+
+    def _match_naics_indexed(
+        self,
+        opp_naics: str | None,
+        index: tuple[frozenset[str], frozenset[str], frozenset[str]],
+    ) -> float:
+        """Same scoring as _match_naics_codes, against a prebuilt _naics_index."""
+        exact, prefix4, prefix2 = index
+        if not opp_naics or not exact:
             return 0.0
 
-        opp_dept = opp.department.lower()
+        opp_naics = opp_naics.strip()
+        if opp_naics in exact:
+            return 30.0
+        if len(opp_naics) >= 4 and opp_naics[:4] in prefix4:
+            return 20.0
+        if len(opp_naics) >= 2 and opp_naics[:2] in prefix2:
+            return 10.0
+        return 0.0
+
+    def _agency_terms(self, agency_preferences: list[str]) -> list[tuple[str, list[str]]]:
+        """
+        Lowercase each agency preference and pull out its significant words
+        (>3 chars) — done once per batch, not once per opportunity.
+        """
+        terms = []
         for pref in agency_preferences:
             pref_lower = pref.lower()
+            terms.append((pref_lower, [w for w in pref_lower.split() if len(w) > 3]))
+        return terms
+
+    def _geo_terms(self, geographic_preferences: list[str]) -> list[str]:
+        """Lowercased geographic preferences, prepared once per batch."""
+        return [geo.lower() for geo in geographic_preferences]
+
+    def _match_agency(self, opp: Opportunity, agency_terms: list[tuple[str, list[str]]]) -> float:
+        """Score agency preference (0-10 points) against _agency_terms output."""
+        if not agency_terms or not opp.department:
+            return 0.0
+
+        opp_dept = opp.department.lower()
+        for pref_lower, key_words in agency_terms:
             # Direct substring match in either direction
             if pref_lower in opp_dept or opp_dept in pref_lower:
                 return 10.0
             # Keyword overlap: SAM.gov uses abbreviations like "DEPT OF DEFENSE"
-            # vs profile value "Department of Defense". Match on significant words (>3 chars).
-            key_words = [w for w in pref_lower.split() if len(w) > 3]
+            # vs profile value "Department of Defense". Match on significant words.
             if key_words and any(w in opp_dept for w in key_words):
                 return 10.0
 
         return 0.0
 
-    def _match_geography(self, opp: Opportunity, geographic_preferences: list[str]) -> float:
-        """Score geographic fit (0-10 points). Shared by profile and cluster paths."""
-        if not geographic_preferences or not opp.place_of_performance:
+    def _match_geography(self, opp: Opportunity, geo_terms: list[str]) -> float:
+        """Score geographic fit (0-10 points) against _geo_terms output."""
+        if not geo_terms or not opp.place_of_performance:
             return 0.0
 
         pop = opp.place_of_performance.lower()
-        for geo in geographic_preferences:
-            if geo.lower() in pop:
+        for geo in geo_terms:
+            if geo in pop:
                 return 10.0
 
         return 0.0
@@ -22,6 +22,16 @@ class ProposalGenerator:
     _MODEL = "claude-haiku-4-5-20251001"
     _MAX_TOKENS = 2048
 
+    def __init__(self):
+        self._client = None
+
+    def _get_client(self):
+        # Built once so the SDK's HTTP connection pool is reused across proposals
+        if self._client is None:
+            import anthropic
+            self._client = anthropic.Anthropic()
+        return self._client
+
     async def generate(
         self,
         opportunity: Opportunity,
@@ -47,8 +57,7 @@ class ProposalGenerator:
         opportunity: Opportunity,
         cluster: CapabilityCluster,
     ) -> dict:
-        import anthropic
-        client = anthropic.Anthropic()
+        client = self._get_client()
 
         team_str = ""
         if cluster.team_roster:
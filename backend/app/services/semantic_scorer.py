@@ -13,14 +13,18 @@ import asyncio
 import logging
 from typing import Optional
 
+import orjson
+
 from app.core.config import get_settings
-from app.core.database import get_db_session
+from app.core.database import db_session
 from app.models.schemas import CapabilityCluster, CompanyProfile, ScoredOpportunity
+from app.services.analyzer import get_anthropic
 from app.services.db_ops import cache_semantic_score, get_cached_semantic_score
 
 logger = logging.getLogger(__name__)
 
 MAX_PER_SEARCH = 10  # Max Claude calls per search request
+MAX_CONCURRENT = 5   # Claude calls in flight at once (stay under rate limits)
 
 
 class SemanticScorer:
@@ -31,18 +35,17 @@ class SemanticScorer:
     getting the semantic signal there is most valuable).
 
     Cache: semantic_scores table — one row per (opportunity_id, cluster_id).
-    If a score is cached it is reused without an API call.
+    If a score is cached it is reused without an API call. Uncached
+    opportunities that share a capability are scored in one batched call.
     """
 
     def __init__(self):
         self.settings = get_settings()
-        self._client = None
 
     def _get_client(self):
-        if self._client is None and self.settings.anthropic_api_key:
-            import anthropic
-            self._client = anthropic.Anthropic(api_key=self.settings.anthropic_api_key)
-        return self._client
+        if not self.settings.anthropic_api_key:
+            return None
+        return get_anthropic()
 
     async def enrich(
         self,
@@ -74,53 +77,60 @@ class SemanticScorer:
         candidates.sort(key=lambda x: x.match_score.naics_score, reverse=True)
         candidates = candidates[:MAX_PER_SEARCH]
 
-        # Build a lookup from notice_id to its position in `scored`
-        idx = {s.opportunity.notice_id: i for i, s in enumerate(scored)}
-
+        # Jobs: (opportunity, cache key, capability text to compare against)
+        jobs = []
         for s in candidates:
-            cluster_id = s.best_cluster_id or "profile"
             capability = self._resolve_capability(s, clusters, profile)
-            if not capability:
-                continue
+            if capability:
+                jobs.append((s, s.best_cluster_id or "profile", capability))
 
-            # Check cache
-            session = await get_db_session()
-            cached = await get_cached_semantic_score(session, s.opportunity.notice_id, cluster_id) if session else None
-
-            if cached is not None:
-                score_0_30 = cached
-                logger.debug(f"Semantic cache hit: {s.opportunity.notice_id}/{cluster_id} → {score_0_30}")
+        # Cache lookups run concurrently, each on its own short-lived session
+        cached = await asyncio.gather(
+            *(self._cached_score(s.opportunity.notice_id, cluster_id) for s, cluster_id, _ in jobs)
+        )
+        scores: dict[int, float] = {}      # job index → 0-30 score
+        groups: dict[str, list[int]] = {}  # cluster_id → uncached job indexes
+        for i, ((s, cluster_id, _), hit) in enumerate(zip(jobs, cached)):
+            if hit is not None:
+                logger.debug(f"Semantic cache hit: {s.opportunity.notice_id}/{cluster_id} → {hit}")
+                scores[i] = hit
             else:
-                score_0_100 = await asyncio.to_thread(
-                    self._call_claude,
-                    s.opportunity.title,
-                    s.opportunity.description or "",
-                    capability,
-                )
-                score_0_30 = round(score_0_100 * 30.0 / 100.0, 1)
-                logger.info(
-                    f"Semantic score {s.opportunity.notice_id}/{cluster_id}: "
-                    f"{score_0_100:.0f}/100 → {score_0_30:.1f}/30"
-                )
-                if session:
-                    await cache_semantic_score(session, s.opportunity.notice_id, cluster_id, score_0_30)
-
-            if session:
-                await session.close()
-
-            # Mutate the ScoredOpportunity in place (and update `scored` via index)
-            i = idx[s.opportunity.notice_id]
-            scored[i].match_score.semantic_score = score_0_30
-            scored[i].match_score.overall_score = min(
-                scored[i].match_score.naics_score
-                + scored[i].match_score.set_aside_score
-                + scored[i].match_score.agency_score
-                + scored[i].match_score.geo_score
+                groups.setdefault(cluster_id, []).append(i)
+
+        # One Claude call per capability: the capability text is sent once and
+        # every uncached opportunity sharing it is scored in the same reply
+        limit = asyncio.Semaphore(MAX_CONCURRENT)
+        results = await asyncio.gather(
+            *(self._score_group([jobs[i] for i in idxs], limit) for idxs in groups.values()),
+            return_exceptions=True,
+        )
+        fresh = []
+        for (cluster_id, idxs), result in zip(groups.items(), results):
+            if isinstance(result, Exception):
+                logger.warning(f"Semantic scoring failed for cluster {cluster_id}: {result}")
+                continue
+            for i, score_0_30 in zip(idxs, result):
+                scores[i] = score_0_30
+                fresh.append((jobs[i][0].opportunity.notice_id, cluster_id, score_0_30))
+        if fresh:
+            async with db_session() as session:
+                for notice_id, cluster_id, score_0_30 in fresh:
+                    await cache_semantic_score(session, notice_id, cluster_id, score_0_30)
+
+        for i, score_0_30 in scores.items():
+            s = jobs[i][0]
+            # Mutate the ScoredOpportunity in place (it is the same object held in `scored`)
+            s.match_score.semantic_score = score_0_30
+            s.match_score.overall_score = min(
+                s.match_score.naics_score
+                + s.match_score.set_aside_score
+                + s.match_score.agency_score
+                + s.match_score.geo_score
                 + score_0_30,
                 100.0,
             )
-            scored[i].match_score.explanation += f". Semantic: {score_0_30:.0f}/30"
-            scored[i].match_tier = _tier(scored[i].match_score.overall_score, self.settings)
+            s.match_score.explanation += f". Semantic: {score_0_30:.0f}/30"
+            s.match_tier = _tier(s.match_score.overall_score, self.settings)
 
         scored.sort(key=lambda x: x.match_score.overall_score, reverse=True)
         return scored
@@ -129,6 +139,52 @@ class SemanticScorer:
     # Helpers
     # ------------------------------------------------------------------
 
+    async def _cached_score(self, notice_id: str, cluster_id: str) -> Optional[float]:
+        async with db_session() as session:
+            return await get_cached_semantic_score(session, notice_id, cluster_id)
+
+    async def _score_group(
+        self,
+        jobs: list[tuple[ScoredOpportunity, str, str]],
+        limit: asyncio.Semaphore,
+    ) -> list[float]:
+        """
+        Score opportunities that share one capability (0-30 each, in job order).
+
+        A group of one uses the single-item prompt. Larger groups go out as one
+        numbered batch prompt; if that reply can't be parsed, each item falls
+        back to its own call.
+        """
+        capability = jobs[0][2]
+        items = [(s.opportunity.title, s.opportunity.description or "") for s, _, _ in jobs]
+
+        raw = None
+        if len(items) > 1:
+            async with limit:
+                raw = await self._call_claude_batch(capability, items)
+            if raw is None:
+                logger.warning(f"Semantic batch reply unusable, scoring {len(items)} items one by one")
+        if raw is None:
+            raw = await asyncio.gather(
+                *(self._call_claude_limited(limit, title, desc, capability) for title, desc in items)
+            )
+
+        scores = []
+        for (s, cluster_id, _), score_0_100 in zip(jobs, raw):
+            score_0_30 = round(score_0_100 * 30.0 / 100.0, 1)
+            logger.info(
+                f"Semantic score {s.opportunity.notice_id}/{cluster_id}: "
+                f"{score_0_100:.0f}/100 → {score_0_30:.1f}/30"
+            )
+            scores.append(score_0_30)
+        return scores
+
+    async def _call_claude_limited(
+        self, limit: asyncio.Semaphore, title: str, description: str, capability: str,
+    ) -> float:
+        async with limit:
+            return await self._call_claude(title, description, capability)
+
     def _resolve_capability(
         self,
         s: ScoredOpportunity,
@@ -141,11 +197,8 @@ class SemanticScorer:
             return profile.capability_statement
         return ""
 
-    def _call_claude(self, title: str, description: str, capability: str) -> float:
-        """
-        Blocking Claude Haiku call — wrapped in asyncio.to_thread by caller.
-        Returns raw score 0-100.
-        """
+    async def _call_claude(self, title: str, description: str, capability: str) -> float:
+        """Claude Haiku call scoring one opportunity. Returns raw score 0-100."""
         client = self._get_client()
         if not client:
             return 0.0
@@ -157,7 +210,7 @@ class SemanticScorer:
             f"Opportunity: {title}\n{description[:1000]}"
         )
         try:
-            resp = client.messages.create(
+            resp = await client.messages.create(
                 model="claude-haiku-4-5-20251001",
                 max_tokens=10,
                 messages=[{"role": "user", "content": prompt}],
@@ -168,6 +221,45 @@ class SemanticScorer:
             logger.warning(f"Claude Haiku semantic call failed: {e}")
             return 0.0
 
+    async def _call_claude_batch(
+        self,
+        capability: str,
+        items: list[tuple[str, str]],
+    ) -> Optional[list[float]]:
+        """
+        Claude Haiku call scoring several (title, description) items against
+        one capability. Returns raw scores 0-100 in item order, or None if the
+        reply is unusable.
+        """
+        client = self._get_client()
+        if not client:
+            return None
+
+        listing = "\n\n".join(
+            f"{i}. {title}\n{description[:600]}"
+            for i, (title, description) in enumerate(items, 1)
+        )
+        prompt = (
+            f"Score 0-100 how well each numbered opportunity matches this capability. "
+            f"Return only a JSON array of {len(items)} numbers, in order.\n\n"
+            f"Capability: {capability[:800]}\n\n"
+            f"Opportunities:\n{listing}"
+        )
+        try:
+            resp = await client.messages.create(
+                model="claude-haiku-4-5-20251001",
+                max_tokens=8 * len(items) + 16,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            text = resp.content[0].text.strip()
+            values = orjson.loads(text[text.index("["):text.rindex("]") + 1])
+            if len(values) != len(items):
+                return None
+            return [min(max(float(v), 0.0), 100.0) for v in values]
+        except Exception as e:
+            logger.warning(f"Claude Haiku semantic batch call failed: {e}")
+            return None
+
 
 def _tier(score: float, settings) -> str:
     if score >= settings.high_match_threshold:
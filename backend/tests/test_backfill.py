@@ -0,0 +1,115 @@
+"""Historical backfill: month producer/consumer, COPY/upsert switch, cancellation."""
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.agents import backfill
+from app.api import routes
+from app.models.schemas import Opportunity
+
+
+@pytest.fixture
+def isolated_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(backfill, "_STATE_FILE", tmp_path / "backfill_state.json")
+    monkeypatch.setattr(backfill, "_STATE_CACHE", None)
+    monkeypatch.setattr(backfill, "_STATE_MTIME", None)
+    monkeypatch.setattr(backfill, "_running", False)
+
+
+@pytest.fixture
+def writes(isolated_state, monkeypatch):
+    """Record DB writes; the first COPY batch succeeds, later ones collide."""
+    log: list[tuple[str, list[str]]] = []
+    copy_results = iter([True, False])
+
+    async def copy(session, opportunities):
+        log.append(("copy", [o.notice_id for o in opportunities]))
+        return next(copy_results, False)
+
+    async def upsert(session, opportunities):
+        log.append(("upsert", [o.notice_id for o in opportunities]))
+
+    async def no_session():
+        return None
+
+    monkeypatch.setattr(backfill, "bulk_insert_opportunities_fast", copy)
+    monkeypatch.setattr(backfill, "upsert_opportunities", upsert)
+    monkeypatch.setattr(backfill, "get_db_session", no_session)
+    return log
+
+
+def _run_month(monkeypatch, count: int) -> tuple[list[Opportunity], dict, int]:
+    """Backfill one month of `count` notices, 2 per page, 2 pages in flight, batches of 3+."""
+    notices = [Opportunity(notice_id=f"n{i}", title=f"T{i}") for i in range(count)]
+    monkeypatch.setattr(backfill, "PAGE_SIZE", 2)
+    monkeypatch.setattr(backfill, "PAGE_CONCURRENCY", 2)
+    monkeypatch.setattr(backfill, "UPSERT_BATCH", 3)
+
+    async def fetch_page(client, base_url, params, state):
+        offset = params["offset"]
+        return notices[offset:offset + params["limit"]]
+
+    monkeypatch.setattr(backfill, "_fetch_page_with_retry", fetch_page)
+    state = backfill._default_state()
+    sam = SimpleNamespace(base_url="https://sam.example")
+
+    upserted = asyncio.run(backfill._fetch_month(
+        None, sam, datetime(2026, 1, 1), datetime(2026, 1, 31), state,
+    ))
+    return notices, state, upserted
+
+
+def test_month_pages_are_buffered_and_written_in_batches(writes, monkeypatch):
+    notices, state, upserted = _run_month(monkeypatch, 9)
+
+    assert upserted == 9
+    assert state["total_upserted"] == 9
+    assert state["total_pages_fetched"] == 5  # 2+2+2+2+1 (short page ends the month)
+    # A write each time the buffer reaches UPSERT_BATCH, then the month's tail
+    assert [ids for _, ids in writes] == [
+        ["n0", "n1", "n2", "n3"], ["n4", "n5", "n6", "n7"], ["n8"],
+    ]
+
+
+def test_month_switches_from_copy_to_upsert_after_a_collision(writes, monkeypatch):
+    _run_month(monkeypatch, 9)
+
+    # First batch COPYs cleanly, the second collides (and is upserted inside
+    # bulk_insert_opportunities_fast), the rest of the month skips COPY
+    assert [kind for kind, _ in writes] == ["copy", "copy", "upsert"]
+
+
+def test_cancel_pauses_backfill_and_keeps_progress(isolated_state, monkeypatch):
+    async def endless_backfill(months, state):
+        state["months_done"] = ["2026-01"]
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(backfill, "_do_backfill", endless_backfill)
+
+    async def main():
+        task = asyncio.create_task(backfill.run_backfill(months=3, resume=False))
+        monkeypatch.setattr(routes, "_backfill_task", task)
+        await asyncio.sleep(0.05)
+        assert await routes.cancel_backfill() == {"status": "cancelling"}
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    state = backfill.load_state()
+    assert state["status"] == "paused"
+    assert state["last_error"] == "Cancelled by request"
+    assert state["months_done"] == ["2026-01"]
+    assert backfill._running is False
+
+
+def test_cancel_without_running_backfill_is_404(monkeypatch):
+    monkeypatch.setattr(routes, "_backfill_task", None)
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(routes.cancel_backfill())
+
+    assert exc.value.status_code == 404
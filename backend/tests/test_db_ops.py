@@ -0,0 +1,163 @@
+"""db_ops: COPY fast path and its upsert fallback, cluster/pursuit hydration."""
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from asyncpg.exceptions import UniqueViolationError
+
+from app.models.schemas import Opportunity
+from app.services import db_ops
+
+
+class FakeDriverConnection:
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.copied: list[tuple] = []
+
+    async def copy_records_to_table(self, table, records, columns):
+        if self.error:
+            raise self.error
+        assert table == "opportunities"
+        self.copied.extend(dict(zip(columns, r)) for r in records)
+
+
+class FakeSession:
+    """Just enough AsyncSession surface for bulk_insert_opportunities_fast."""
+
+    def __init__(self, driver: FakeDriverConnection):
+        self.driver = driver
+        self.commits = self.rollbacks = 0
+
+    async def connection(self):
+        return self
+
+    async def get_raw_connection(self):
+        return self
+
+    @property
+    def driver_connection(self):
+        return self.driver
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def upserted(monkeypatch):
+    calls: list[list[str]] = []
+
+    async def record(session, opportunities):
+        calls.append([o.notice_id for o in opportunities])
+
+    monkeypatch.setattr(db_ops, "upsert_opportunities", record)
+    return calls
+
+
+def _opps():
+    return [
+        Opportunity(notice_id="a", title="A"),
+        Opportunity(notice_id="b", title="B"),
+        Opportunity(notice_id="a", title="A (updated)", point_of_contact={"email": "a@x.gov"}),
+    ]
+
+
+def test_copy_writes_deduplicated_rows(upserted):
+    driver = FakeDriverConnection()
+    session = FakeSession(driver)
+
+    ok = asyncio.run(db_ops.bulk_insert_opportunities_fast(session, _opps()))
+
+    assert ok is True
+    assert upserted == []
+    assert session.commits == 1
+    assert [r["notice_id"] for r in driver.copied] == ["a", "b"]
+    assert driver.copied[0]["title"] == "A (updated)"  # last copy wins
+    assert driver.copied[0]["point_of_contact"] == '{"email":"a@x.gov"}'  # jsonb as text
+    assert driver.copied[1]["point_of_contact"] is None
+    assert driver.copied[1]["complexity_tier"] == "STANDARD"
+
+
+def test_existing_rows_fall_back_to_upsert(upserted):
+    session = FakeSession(FakeDriverConnection(UniqueViolationError("duplicate key")))
+
+    ok = asyncio.run(db_ops.bulk_insert_opportunities_fast(session, _opps()))
+
+    assert ok is False
+    assert session.rollbacks == 1
+    assert upserted == [["a", "b", "a"]]
+
+
+def test_other_copy_errors_also_fall_back_to_upsert(upserted):
+    session = FakeSession(FakeDriverConnection(RuntimeError("codec")))
+
+    ok = asyncio.run(db_ops.bulk_insert_opportunities_fast(session, _opps()))
+
+    assert ok is False
+    assert len(upserted) == 1
+
+
+def test_no_session_is_a_no_op(upserted):
+    assert asyncio.run(db_ops.bulk_insert_opportunities_fast(None, _opps())) is True
+    assert upserted == []
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeQuerySession:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def execute(self, stmt):
+        return FakeResult(self.rows)
+
+
+def _pursuit_row(pid, created_at, updated_at):
+    return SimpleNamespace(
+        id=pid, opportunity_id="n1", cluster_id=None, status="identified",
+        notes=None, assigned_team=None, created_at=created_at, updated_at=updated_at,
+    )
+
+
+def _cluster_row(cid, created_at):
+    return SimpleNamespace(
+        id=cid, name=cid, naics_codes=["541512"], certifications=["8(a)"],
+        capability_description=None,
+        team_roster=[{"name": "Ada", "role": "PM"}], created_at=created_at,
+    )
+
+
+def test_pursuits_with_null_timestamps_are_skipped():
+    now = datetime(2026, 1, 1)
+    rows = [
+        _pursuit_row("ok", now, now),
+        _pursuit_row("no-created", None, now),
+        _pursuit_row("no-updated", now, None),
+    ]
+
+    pursuits = asyncio.run(db_ops.get_all_pursuits_from_db(FakeQuerySession(rows)))
+
+    assert [p.id for p in pursuits] == ["ok"]
+    assert pursuits[0].created_at.isoformat() == "2026-01-01T00:00:00"
+
+
+def test_clusters_load_unvalidated_but_null_created_at_is_skipped():
+    rows = [_cluster_row("ok", datetime(2026, 1, 1)), _cluster_row("no-created", None)]
+
+    clusters = asyncio.run(db_ops.get_all_clusters_from_db(FakeQuerySession(rows)))
+
+    assert [c.id for c in clusters] == ["ok"]
+    assert clusters[0].team_roster[0].clearance is None
+    assert clusters[0].capability_description == ""
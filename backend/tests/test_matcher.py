@@ -0,0 +1,45 @@
+"""MatchingEngine NAICS scoring: indexed lookup vs. the reference scan."""
+import random
+
+import pytest
+
+from app.services.matcher import MatchingEngine
+
+
+@pytest.fixture
+def engine():
+    return MatchingEngine()
+
+
+@pytest.mark.parametrize("opp_naics, codes, expected", [
+    ("541512", ["541512"], 30.0),
+    (" 541512 ", ["541512"], 30.0),
+    ("541519", ["541512"], 20.0),
+    ("541330", ["541512"], 10.0),
+    ("236220", ["541512"], 0.0),
+    ("54", ["541512"], 10.0),
+    ("541512", ["54"], 10.0),
+    ("5", ["541512"], 0.0),
+    (None, ["541512"], 0.0),
+    ("541512", [], 0.0),
+])
+def test_indexed_matches_reference_on_edge_cases(engine, opp_naics, codes, expected):
+    index = engine._naics_index(codes)
+
+    assert engine._match_naics_codes(opp_naics, codes) == expected
+    assert engine._match_naics_indexed(opp_naics, index) == expected
+
+
+def test_indexed_matches_reference_on_random_codes(engine):
+    rng = random.Random(1234)
+
+    def code() -> str:
+        # Small alphabet and mixed lengths so prefix collisions are common
+        return "".join(rng.choice("1245") for _ in range(rng.choice((1, 2, 3, 4, 5, 6))))
+
+    for _ in range(5000):
+        codes = [code() for _ in range(rng.randint(0, 6))]
+        opp_naics = rng.choice((None, "", code(), f" {code()} "))
+        index = engine._naics_index(codes)
+
+        assert engine._match_naics_indexed(opp_naics, index) == engine._match_naics_codes(opp_naics, codes)
@@ -0,0 +1,86 @@
+"""Scout JSONL state files: reading, torn lines, compaction."""
+import asyncio
+
+import orjson
+import pytest
+
+from app.agents import scout
+
+
+@pytest.fixture
+def state_files(tmp_path, monkeypatch):
+    state = tmp_path / "scout_state.json"
+    monkeypatch.setattr(scout, "_STATE_FILE", state)
+    monkeypatch.setattr(scout, "_SEEN_FILE", state.with_name("scout_seen_ids.jsonl"))
+    monkeypatch.setattr(scout, "_RUNS_FILE", state.with_name("scout_runs.jsonl"))
+    return tmp_path
+
+
+def test_corrupt_middle_line_keeps_later_records(tmp_path):
+    path = tmp_path / "seen.jsonl"
+    path.write_bytes(b'"a"\n"b"\n{"torn": \n"c"\n"d"\n')
+
+    tail, count, bad = scout._read_jsonl_tail(path, cap=10)
+
+    assert list(tail) == ["a", "b", "c", "d"]
+    assert count == 5
+    assert bad == 1
+
+
+def test_append_after_torn_line_does_not_glue_records(tmp_path):
+    path = tmp_path / "seen.jsonl"
+    path.write_bytes(b'"a"\n"tor')  # crash mid-append, no trailing newline
+
+    scout._append_jsonl(path, ["b", "c"])
+    tail, _, bad = scout._read_jsonl_tail(path, cap=10)
+
+    assert list(tail) == ["a", "b", "c"]
+    assert bad == 1
+
+
+def test_compaction_rewrites_corrupt_lines(state_files):
+    scout._SEEN_FILE.write_bytes(b'"a"\nnot json\n"b"\n')
+
+    state = scout._load_state(compact=True)
+
+    assert list(state["seen_notice_ids"]) == ["a", "b"]
+    assert scout._SEEN_FILE.read_bytes() == b'"a"\n"b"\n'
+
+
+def test_get_state_before_first_run_does_not_migrate(state_files, monkeypatch):
+    monkeypatch.setattr(scout, "_STATE", None)
+    scout._STATE_FILE.write_bytes(orjson.dumps({
+        "last_run_at": "2026-01-01T00:00:00",
+        "seen_notice_ids": ["a", "b"],
+        "runs": [],
+    }))
+
+    state = asyncio.run(scout.ScoutAgent.get_state())
+
+    assert list(state["seen_notice_ids"]) == ["a", "b"]
+    assert not scout._SEEN_FILE.exists()
+
+
+def test_migration_normalises_legacy_run_at_to_epoch(state_files):
+    scout._STATE_FILE.write_bytes(orjson.dumps({
+        "last_run_at": "2026-01-01T06:00:00",
+        "seen_notice_ids": ["a"],
+        "runs": [{"run_at": "2026-01-01T00:00:00", "total_fetched": 3, "new_count": 1}],
+    }))
+
+    state = scout._load_state(compact=True)
+
+    assert list(state["runs"]) == [{"run_at": 1767225600, "total_fetched": 3, "new_count": 1}]
+    assert orjson.loads(scout._RUNS_FILE.read_bytes())["run_at"] == 1767225600
+    assert list(state["seen_notice_ids"]) == ["a"]
+
+
+def test_already_migrated_iso_run_at_is_converted_on_read(state_files):
+    scout._RUNS_FILE.write_bytes(
+        b'{"run_at": "2026-01-01T00:00:00", "total_fetched": 1, "new_count": 0}\n'
+        b'{"run_at": 1767229200, "total_fetched": 2, "new_count": 1}\n'
+    )
+
+    state = scout._load_state()
+
+    assert [r["run_at"] for r in state["runs"]] == [1767225600, 1767229200]
@@ -0,0 +1,101 @@
+"""Opportunity search: fetch cache, single-flight fetches and the response cache."""
+import asyncio
+
+import pytest
+
+from app.api import routes
+from app.models.schemas import CompanyProfile, Opportunity, SearchFilters
+
+
+class FakeSAM:
+    def __init__(self):
+        self.calls = 0
+
+    async def search_opportunities(self, filters):
+        self.calls += 1
+        await asyncio.sleep(0.05)  # long enough for concurrent searches to pile up
+        return [Opportunity(notice_id="n1", title="Robotics support", naics_code="541512")]
+
+
+@pytest.fixture
+def sam(monkeypatch):
+    fake = FakeSAM()
+    monkeypatch.setattr(routes, "sam_client", fake)
+    monkeypatch.setattr(routes, "upsert_opportunities", _no_upsert)
+    monkeypatch.setattr(routes, "_upsert_queue", None)
+    monkeypatch.setattr(routes, "_upsert_task", None)
+    routes._search_cache.clear()
+    routes._search_response_cache.clear()
+    routes._inflight_fetches.clear()
+    yield fake
+    routes._search_cache.clear()
+    routes._search_response_cache.clear()
+
+
+async def _no_upsert(session, opportunities):
+    pass
+
+
+async def _search(filters: SearchFilters, profile_id=None):
+    return await routes.search_opportunities(
+        filters, profile_id=profile_id, cluster_ids=[], enrich=False, include_subnet=False,
+    )
+
+
+def test_concurrent_identical_searches_share_one_fetch(sam):
+    async def main():
+        results = await asyncio.gather(*(_search(SearchFilters()) for _ in range(5)))
+        await routes.stop_upsert_worker()
+        return results
+
+    results = asyncio.run(main())
+
+    assert sam.calls == 1
+    assert len({r.body for r in results}) == 1
+    assert routes._inflight_fetches == {}
+
+
+def test_scored_response_is_cached_when_nothing_changed(sam, monkeypatch):
+    profile = CompanyProfile(id="p1", company_name="Acme", naics_codes=["541512"])
+    monkeypatch.setitem(routes._profiles, "p1", profile)
+
+    async def main():
+        await _search(SearchFilters(), profile_id="p1")
+        await routes.stop_upsert_worker()
+
+    asyncio.run(main())
+
+    assert len(routes._search_response_cache) == 1
+
+
+def test_repeat_search_is_served_from_cache(sam):
+    async def main():
+        await _search(SearchFilters(naics_codes=["541512", "236220"]))
+        # Same filters in a different order hit the same cache entry
+        await _search(SearchFilters(naics_codes=["236220", "541512"]))
+        await routes.stop_upsert_worker()
+
+    asyncio.run(main())
+
+    assert sam.calls == 1
+
+
+def test_invalidation_during_scoring_skips_caching_stale_response(sam, monkeypatch):
+    profile = CompanyProfile(id="p1", company_name="Acme", naics_codes=["541512"])
+    monkeypatch.setitem(routes._profiles, "p1", profile)
+    score = routes.matcher.score_opportunities
+
+    def score_then_profile_changes(opportunities, profile):
+        scored = score(opportunities, profile)
+        routes._invalidate_search_responses()  # e.g. a profile update lands mid-scoring
+        return scored
+
+    monkeypatch.setattr(routes.matcher, "score_opportunities", score_then_profile_changes)
+
+    async def main():
+        await _search(SearchFilters(), profile_id="p1")
+        await routes.stop_upsert_worker()
+
+    asyncio.run(main())
+
+    assert routes._search_response_cache == {}
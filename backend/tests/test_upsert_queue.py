@@ -0,0 +1,68 @@
+"""Search-driven opportunity upserts: coalescing queue and shutdown flush."""
+import asyncio
+
+import pytest
+
+from app.api import routes
+from app.models.schemas import Opportunity
+
+
+@pytest.fixture
+def written(monkeypatch):
+    calls: list[list[str]] = []
+
+    async def record(session, opportunities):
+        calls.append([o.notice_id for o in opportunities])
+
+    monkeypatch.setattr(routes, "upsert_opportunities", record)
+    monkeypatch.setattr(routes, "_upsert_queue", None)
+    monkeypatch.setattr(routes, "_upsert_task", None)
+    return calls
+
+
+def _opps(*ids: str) -> list[Opportunity]:
+    return [Opportunity(notice_id=i, title=i) for i in ids]
+
+
+def test_burst_of_searches_coalesces_into_one_upsert(written):
+    async def main():
+        routes._queue_opportunity_upsert(_opps("a", "b"))
+        routes._queue_opportunity_upsert(_opps("c"))
+        routes._queue_opportunity_upsert(_opps("d"))
+        await asyncio.sleep(routes.UPSERT_COALESCE_WINDOW * 4)
+        await routes.stop_upsert_worker()
+
+    asyncio.run(main())
+
+    assert written == [["a", "b", "c", "d"]]
+
+
+def test_batches_after_the_window_are_written_separately(written):
+    async def main():
+        routes._queue_opportunity_upsert(_opps("a"))
+        await asyncio.sleep(routes.UPSERT_COALESCE_WINDOW * 4)
+        routes._queue_opportunity_upsert(_opps("b"))
+        await asyncio.sleep(routes.UPSERT_COALESCE_WINDOW * 4)
+        await routes.stop_upsert_worker()
+
+    asyncio.run(main())
+
+    assert written == [["a"], ["b"]]
+
+
+def test_stop_flushes_queued_batches(written):
+    async def main():
+        routes._queue_opportunity_upsert(_opps("a"))
+        routes._queue_opportunity_upsert(_opps("b"))
+        await routes.stop_upsert_worker()  # sentinel lands inside the window
+
+    asyncio.run(main())
+
+    assert written == [["a", "b"]]
+    assert routes._upsert_queue is None
+
+
+def test_stop_without_worker_is_a_no_op(written):
+    asyncio.run(routes.stop_upsert_worker())
+
+    assert written == []